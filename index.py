@@ -12,7 +12,7 @@ from PyQt5.QtWidgets import QApplication, QMessageBox
 from PyQt5.QtCore import QTimer
 
 from src.config_manager import ConfigManager
-from src.file_manager import FileManager
+from src.file_manager import get_file_manager
 from src.log_parser import LogParser
 from src.inventory_tracker import InventoryTracker
 from src.statistics_tracker import StatisticsTracker
@@ -55,12 +55,11 @@ def main():
     # Create QApplication
     app = QApplication(sys.argv)
 
-    # Initialize managers
+    # Initialize managers (ConfigManager creates config.json if it is missing)
     config_manager = ConfigManager()
-    file_manager = FileManager()
+    file_manager = get_file_manager()
 
     # Initialize data files
-    file_manager.ensure_file_exists("config.json", {"opacity": 1.0, "tax": 0, "user": ""})
     file_manager.initialize_full_table_from_en_table()
 
     # Initialize core components
@@ -98,7 +97,7 @@ def main():
     signals = WorkerSignals()
     signals.initialization_complete.connect(tracker_app.on_initialization_complete)
     signals.update_display.connect(tracker_app.update_display)
-    signals.reshow_drops.connect(tracker_app.reshow)
+    signals.reshow_drops.connect(tracker_app.schedule_reshow)
 
     # Start log monitoring thread
     monitor = LogMonitorThread(
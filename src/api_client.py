@@ -4,17 +4,23 @@ Handles all HTTP communication with the remote API.
 """
 import logging
 import time
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from threading import Lock
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .constants import (
     API_CACHE_TTL,
+    API_POOL_CONNECTIONS,
+    API_POOL_MAXSIZE,
     API_RATE_LIMIT_CALLS,
     API_RATE_LIMIT_WINDOW,
-    API_RETRY_BASE_DELAY,
+    API_RETRY_BACKOFF_FACTOR,
+    API_RETRY_STATUS_CODES,
+    API_SYNC_MAX_WORKERS,
 )
 
 logger = logging.getLogger(__name__)
@@ -30,12 +36,12 @@ class APIClient:
         Args:
             base_url: Base URL of the API (e.g., "https://torchlight-price-tracker.onrender.com")
             timeout: Request timeout in seconds
-            max_retries: Maximum number of retry attempts for failed requests
+            max_retries: Maximum number of attempts per request, including the first
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.max_retries = max_retries
-        self.session = requests.Session()
+        self.session = self._create_session()
         self._cache: Dict[str, Any] = {}
         self._cache_lock = Lock()
         self._cache_timestamp: Optional[float] = None
@@ -44,37 +50,72 @@ class APIClient:
         # Rate limiting
         self._rate_limit_calls = API_RATE_LIMIT_CALLS
         self._rate_limit_window = API_RATE_LIMIT_WINDOW
-        self._request_timestamps: deque = deque()
+        # Token bucket: holds up to _rate_limit_calls tokens, refilled evenly over the window
+        self._tokens = float(self._rate_limit_calls)
+        self._last_refill = time.monotonic()
+        self._refill_rate = self._rate_limit_calls / self._rate_limit_window
         self._rate_limit_lock = Lock()
 
+    def _create_session(self) -> requests.Session:
+        """
+        Create an HTTP session with pooled keep-alive connections and retries.
+
+        Retries with exponential backoff are handled by urllib3 for connection
+        errors, timeouts and the status codes in API_RETRY_STATUS_CODES.
+        Other client errors (4xx) are not retried.
+
+        Returns:
+            Configured requests session.
+        """
+        # urllib3 counts retries after the first attempt, max_retries counts attempts
+        retry = Retry(
+            total=max(0, self.max_retries - 1),
+            backoff_factor=API_RETRY_BACKOFF_FACTOR,
+            status_forcelist=API_RETRY_STATUS_CODES,
+            allowed_methods=frozenset(("GET", "POST", "PUT")),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=API_POOL_CONNECTIONS,
+            pool_maxsize=API_POOL_MAXSIZE,
+            max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     def _check_rate_limit(self) -> None:
         """
         Check and enforce rate limiting.
         Blocks if rate limit would be exceeded, waiting until a request slot is available.
+        The lock is released while waiting so other threads are not stalled behind it.
         """
-        with self._rate_limit_lock:
-            now = time.time()
-
-            # Remove timestamps outside the current window
-            while self._request_timestamps and self._request_timestamps[0] < now - self._rate_limit_window:
-                self._request_timestamps.popleft()
-
-            # If at limit, wait until oldest request falls outside window
-            if len(self._request_timestamps) >= self._rate_limit_calls:
-                oldest_request = self._request_timestamps[0]
-                wait_time = self._rate_limit_window - (now - oldest_request)
-                if wait_time > 0:
-                    logger.warning(f"Rate limit reached. Waiting {wait_time:.1f}s before next request")
-                    time.sleep(wait_time)
-                    # Recursive call after waiting
-                    return self._check_rate_limit()
-
-            # Record this request
-            self._request_timestamps.append(now)
+        while True:
+            with self._rate_limit_lock:
+                now = time.monotonic()
+
+                # Refill for the time elapsed since the last request
+                self._tokens = min(
+                    float(self._rate_limit_calls),
+                    self._tokens + (now - self._last_refill) * self._refill_rate
+                )
+                self._last_refill = now
+
+                # Take a token if one is available
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                # At limit, wait until the missing fraction of a token has refilled
+                wait_time = (1 - self._tokens) / self._refill_rate
+
+            logger.debug(f"Rate limit reached. Waiting {wait_time:.2f}s before next request")
+            time.sleep(wait_time)
 
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Optional[requests.Response]:
         """
-        Make HTTP request with retry logic.
+        Make HTTP request. Retries and backoff are handled by the session adapter.
 
         Args:
             method: HTTP method (GET, POST, PUT)
@@ -82,7 +123,7 @@ class APIClient:
             **kwargs: Additional arguments to pass to requests
 
         Returns:
-            Response object or None if all retries failed
+            Response object or None if the request failed
 
         Raises:
             ValueError: If DELETE method is attempted
@@ -97,39 +138,18 @@ class APIClient:
         url = f"{self.base_url}{endpoint}"
         kwargs.setdefault('timeout', self.timeout)
 
-        last_exception = None
-        for attempt in range(self.max_retries):
-            try:
-                response = self.session.request(method, url, **kwargs)
-                response.raise_for_status()
-                return response
-            except requests.exceptions.HTTPError as e:
-                last_exception = e
-                logger.warning(f"HTTP error on attempt {attempt + 1}/{self.max_retries}: {e}")
-                # Don't retry on client errors (4xx) except timeout-related ones
-                if hasattr(e, 'response') and e.response is not None:
-                    status_code = e.response.status_code
-                    if 400 <= status_code < 500 and status_code not in (408, 429):
-                        logger.error(f"Client error {status_code} for {method} {url}, not retrying")
-                        return None
-            except requests.exceptions.Timeout as e:
-                last_exception = e
-                logger.warning(f"Timeout on attempt {attempt + 1}/{self.max_retries}: {e}")
-            except requests.exceptions.ConnectionError as e:
-                last_exception = e
-                logger.warning(f"Connection error on attempt {attempt + 1}/{self.max_retries}: {e}")
-            except requests.exceptions.RequestException as e:
-                last_exception = e
-                logger.warning(f"Request error on attempt {attempt + 1}/{self.max_retries}: {e}")
-
-            # If this was the last attempt, log final error
-            if attempt == self.max_retries - 1:
-                logger.error(f"Failed to {method} {url} after {self.max_retries} attempts. Last error: {last_exception}")
-                return None
-
-            # Exponential backoff
-            time.sleep(API_RETRY_BASE_DELAY ** attempt)
-
+        try:
+            response = self.session.request(method, url, **kwargs)
+            response.raise_for_status()
+            return response
+        except requests.exceptions.HTTPError as e:
+            logger.error(f"HTTP error for {method} {url}: {e}")
+        except requests.exceptions.Timeout as e:
+            logger.error(f"Timeout for {method} {url}: {e}")
+        except requests.exceptions.ConnectionError as e:
+            logger.error(f"Connection error for {method} {url}: {e}")
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request error for {method} {url}: {e}")
         return None
 
     def health_check(self) -> bool:
@@ -152,6 +172,9 @@ class APIClient:
         """
         Get all items from the API.
 
+        The returned dictionary is the caller's own copy, taken under the
+        cache lock, so later cache updates never change it.
+
         Args:
             item_type: Optional filter by item type
             use_cache: Whether to use cached data if available
@@ -179,12 +202,13 @@ class APIClient:
         if response:
             try:
                 data = response.json()
+                logger.debug(f"Retrieved {len(data)} items from API")
                 # Update cache only if we fetched all items
                 if not item_type:
                     with self._cache_lock:
                         self._cache = data
-                        self._cache_timestamp = time.time()
-                logger.debug(f"Retrieved {len(data)} items from API")
+                        self._cache_timestamp = time.monotonic()
+                        return data.copy()
                 return data
             except ValueError as e:
                 logger.error(f"Failed to parse JSON response: {e}")
@@ -203,8 +227,9 @@ class APIClient:
         # Check cache first
         if self._is_cache_valid():
             with self._cache_lock:
-                if item_id in self._cache:
-                    return self._cache[item_id].copy()
+                item_data = self._cache.get(item_id)
+                if item_data is not None:
+                    return item_data.copy()
 
         response = self._make_request('GET', f'/items/{item_id}')
         if response:
@@ -212,7 +237,7 @@ class APIClient:
                 data = response.json()
                 # Update item in cache
                 with self._cache_lock:
-                    if self._cache_timestamp:  # Only update if cache exists
+                    if self._cache_timestamp is not None:  # Only update if cache exists
                         self._cache[item_id] = data
                 return data
             except ValueError as e:
@@ -267,6 +292,34 @@ class APIClient:
                 logger.error(f"Failed to parse JSON response: {e}")
         return None
 
+    def update_items(self, updates_by_id: Dict[str, Dict[str, Any]]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Update several existing items, sending the requests concurrently.
+
+        The API has no bulk endpoint, so each item is still its own PUT, but
+        the round-trips overlap instead of running back to back.
+
+        Args:
+            updates_by_id: Dictionary of {item_id: fields to update}
+
+        Returns:
+            Dictionary of {item_id: updated item data, or None if that update failed}
+        """
+        if not updates_by_id:
+            return {}
+        if len(updates_by_id) == 1:
+            item_id, updates = next(iter(updates_by_id.items()))
+            return {item_id: self.update_item(item_id, updates)}
+
+        # Overlap request latency; _check_rate_limit() still bounds throughput
+        max_workers = min(API_SYNC_MAX_WORKERS, self._rate_limit_calls, len(updates_by_id))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                item_id: executor.submit(self.update_item, item_id, updates)
+                for item_id, updates in updates_by_id.items()
+            }
+            return {item_id: future.result() for item_id, future in futures.items()}
+
     def delete_item(self, item_id: str) -> bool:
         """
         Delete an item.
@@ -315,15 +368,15 @@ class APIClient:
     def invalidate_cache(self):
         """Invalidate the cache, forcing a fresh fetch on next request."""
         with self._cache_lock:
-            self._cache.clear()
+            self._cache = {}
             self._cache_timestamp = None
         logger.debug("Cache invalidated")
 
     def _is_cache_valid(self) -> bool:
         """Check if cache is still valid based on TTL."""
-        if not self._cache_timestamp:
+        if self._cache_timestamp is None:
             return False
-        return (time.time() - self._cache_timestamp) < self._cache_ttl
+        return (time.monotonic() - self._cache_timestamp) < self._cache_ttl
 
     def sync_local_to_api(self, local_data: Dict[str, Dict]) -> int:
         """
@@ -336,20 +389,28 @@ class APIClient:
             Number of items successfully synced
         """
         logger.info(f"Starting sync of {len(local_data)} items to API")
-        success_count = 0
-
-        for item_id, item_data in local_data.items():
-            # Try to get existing item
-            existing = self.get_item(item_id)
-
-            if existing:
-                # Update existing item
-                if self.update_item(item_id, item_data):
-                    success_count += 1
-            else:
-                # Create new item
-                if self.create_item(item_id, item_data):
-                    success_count += 1
+        if not local_data:
+            return 0
+
+        # One listing request tells us which items already exist, instead of
+        # a GET per item
+        existing = self.get_all_items(use_cache=False)
+        if existing is None:
+            logger.error("Sync aborted: could not fetch existing items from API")
+            return 0
+
+        # Overlap request latency; _check_rate_limit() still bounds throughput
+        max_workers = min(API_SYNC_MAX_WORKERS, self._rate_limit_calls, len(local_data))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.update_item if item_id in existing else self.create_item,
+                    item_id,
+                    item_data
+                )
+                for item_id, item_data in local_data.items()
+            ]
+            success_count = sum(1 for future in futures if future.result())
 
         logger.info(f"Sync complete: {success_count}/{len(local_data)} items synced")
         return success_count
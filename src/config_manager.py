@@ -5,16 +5,22 @@ Handles loading, saving, and validating configuration settings.
 
 import json
 import logging
-from pathlib import Path
+import os
+import sys
+import threading
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 
-from .constants import CONFIG_FILE, DEFAULT_CONFIG, get_resource_path, get_writable_path
+from .constants import CONFIG_FILE, CONFIG_SAVE_DELAY, DEFAULT_CONFIG, get_resource_path, get_writable_path
+from .json_utils import atomic_write_bytes, json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) is only accepted from Python 3.10 on
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class AppConfig:
     """Application configuration data class."""
     opacity: float = 1.0
@@ -29,10 +35,9 @@ class AppConfig:
     window_width: Optional[int] = None
     window_height: Optional[int] = None
 
-    def __post_init__(self):
-        """Validate configuration values after initialization."""
-        self.opacity = max(0.1, min(1.0, self.opacity))
-        self.tax = max(0, min(1, self.tax))
+
+# Keys accepted from config.json, derived from AppConfig so the two never drift apart
+_KNOWN_FIELDS = frozenset(field.name for field in fields(AppConfig))
 
 
 class ConfigManager:
@@ -47,30 +52,34 @@ class ConfigManager:
         """
         self.config_file_name = config_file  # Store the relative path
         self._config: Optional[AppConfig] = None
+        self._tax_enabled: Optional[bool] = None  # Cached is_tax_enabled() result
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
         self._ensure_config_exists()
 
     def _ensure_config_exists(self) -> None:
         """Create default configuration file if it doesn't exist in writable location."""
-        resource_path = Path(get_resource_path(self.config_file_name))
-        writable_path = Path(get_writable_path(self.config_file_name))
+        resource_path = get_resource_path(self.config_file_name)
+        writable_path = get_writable_path(self.config_file_name)
 
         # If file doesn't exist in either location, create it in writable location
-        if not resource_path.exists() and not writable_path.exists():
+        if not os.path.exists(resource_path) and not os.path.exists(writable_path):
             logger.info(f"Creating default configuration file: {writable_path}")
             self._save_dict(DEFAULT_CONFIG)
 
     def _save_dict(self, config_dict: Dict[str, Any]) -> None:
         """
         Save configuration dictionary to file.
-        Always saves to writable location (next to executable).
+        Always saves to writable location (next to executable), replacing the
+        file atomically.
 
         Args:
             config_dict: Configuration dictionary to save.
         """
         try:
             writable_path = get_writable_path(self.config_file_name)
-            with open(writable_path, 'w', encoding='utf-8') as f:
-                json.dump(config_dict, f, ensure_ascii=False, indent=4)
+            atomic_write_bytes(writable_path, json_dumps(config_dict))
         except IOError as e:
             logger.error(f"Failed to save configuration: {e}")
             raise
@@ -86,17 +95,18 @@ class ConfigManager:
         Raises:
             ValueError: If configuration file is invalid.
         """
+        self._tax_enabled = None
         try:
             config_path = get_resource_path(self.config_file_name)
             logger.info(f"Loading config from: {config_path}")
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_dict = json.load(f)
+            with open(config_path, 'rb') as f:
+                config_dict = json_loads(f.read())
 
             # Filter to only known fields for backward compatibility
-            known_fields = {'opacity', 'tax', 'user', 'api_enabled', 'api_url', 'api_timeout', 'use_local_fallback', 'window_x', 'window_y', 'window_width', 'window_height'}
-            filtered_config = {k: v for k, v in config_dict.items() if k in known_fields}
+            filtered_config = {k: v for k, v in config_dict.items() if k in _KNOWN_FIELDS}
 
             self._config = AppConfig(**filtered_config)
+            self._clamp(self._config)
             logger.info("Configuration loaded successfully")
             return self._config
 
@@ -111,6 +121,18 @@ class ConfigManager:
             self._config = AppConfig(**DEFAULT_CONFIG)
             return self._config
 
+    @staticmethod
+    def _clamp(config: AppConfig) -> None:
+        """
+        Clamp loaded values into their valid ranges.
+        Values set through the update_* methods are clamped there instead.
+
+        Args:
+            config: Configuration to validate in place.
+        """
+        config.opacity = max(0.1, min(1.0, config.opacity))
+        config.tax = max(0, min(1, config.tax))
+
     def save(self, config: Optional[AppConfig] = None) -> None:
         """
         Save configuration to file.
@@ -120,14 +142,50 @@ class ConfigManager:
         """
         if config is not None:
             self._config = config
+            self._tax_enabled = None
 
         if self._config is None:
             logger.warning("No configuration to save")
             return
 
-        self._save_dict(asdict(self._config))
+        with self._save_lock:
+            self._cancel_flush_timer()
+            self._dirty = False
+            self._save_dict(asdict(self._config))
         logger.info("Configuration saved successfully")
 
+    def _cancel_flush_timer(self) -> None:
+        """Cancel a pending debounced write. Must be called with _save_lock held."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _mark_dirty(self) -> None:
+        """
+        Record an in-memory change and schedule a debounced write.
+        Each call restarts the delay, so a burst of updates is written once.
+        """
+        with self._save_lock:
+            self._dirty = True
+            self._cancel_flush_timer()
+            self._flush_timer = threading.Timer(CONFIG_SAVE_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write pending configuration changes to file, if any."""
+        with self._save_lock:
+            self._cancel_flush_timer()
+            if not self._dirty or self._config is None:
+                return
+            try:
+                self._save_dict(asdict(self._config))
+                self._dirty = False
+            except IOError:
+                # Already logged by _save_dict; keep the changes pending
+                return
+        logger.debug("Pending configuration changes written")
+
     def get(self) -> AppConfig:
         """
         Get current configuration.
@@ -148,7 +206,7 @@ class ConfigManager:
         """
         config = self.get()
         config.opacity = max(0.1, min(1.0, opacity))
-        self.save()
+        self._mark_dirty()
         logger.debug(f"Opacity updated to {config.opacity}")
 
     def update_tax(self, tax_enabled: int) -> None:
@@ -160,7 +218,8 @@ class ConfigManager:
         """
         config = self.get()
         config.tax = max(0, min(1, tax_enabled))
-        self.save()
+        self._tax_enabled = config.tax == 1
+        self._mark_dirty()
         logger.debug(f"Tax setting updated to {config.tax}")
 
     def is_tax_enabled(self) -> bool:
@@ -170,11 +229,16 @@ class ConfigManager:
         Returns:
             True if tax is enabled, False otherwise.
         """
-        return self.get().tax == 1
+        tax_enabled = self._tax_enabled
+        if tax_enabled is None:
+            tax_enabled = self._tax_enabled = self.get().tax == 1
+        return tax_enabled
 
     def update_window_geometry(self, x: int, y: int, width: int, height: int) -> None:
         """
-        Update window geometry settings.
+        Update window geometry settings and write them out immediately.
+        The main window already debounces move/resize events before calling
+        this, so it is not debounced a second time here.
 
         Args:
             x: Window x position.
@@ -3,8 +3,22 @@ Constants used throughout the Torchlight Infinite Price Tracker application.
 """
 
 import os
+import re
 import sys
-from typing import List
+from functools import lru_cache
+from typing import Dict, FrozenSet, Tuple
+
+
+# Runtime layout, resolved once: a process never switches between frozen and script mode
+_IS_FROZEN = getattr(sys, 'frozen', False)
+# Directory holding the executable (frozen) or the project root (script)
+_APP_DIR = (os.path.dirname(sys.executable) if _IS_FROZEN
+            else os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# PyInstaller extracts bundled resources to a temp folder and stores it in _MEIPASS
+_MEIPASS = getattr(sys, '_MEIPASS', _APP_DIR)
+
+# Resource paths that resolved to a file in the application directory
+_resolved_resource_paths: Dict[str, str] = {}
 
 
 def get_resource_path(relative_path: str) -> str:
@@ -15,35 +29,34 @@ def get_resource_path(relative_path: str) -> str:
     1. First check in the directory where the executable/script is located
     2. Fall back to the bundled resource if not found
 
+    Only hits on the user's copy are cached: a bundled fallback may be
+    superseded later when the app writes its own copy next to the executable.
+
     Args:
         relative_path: Relative path to the resource file
 
     Returns:
         Absolute path to the resource
     """
-    # Get the directory where the executable or script is located
-    if getattr(sys, 'frozen', False):
-        # Running as compiled executable
-        application_path = os.path.dirname(sys.executable)
-    else:
-        # Running as script
-        application_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    cached = _resolved_resource_paths.get(relative_path)
+    if cached is not None:
+        return cached
 
     # Check if file exists in application directory (user's config)
-    user_file_path = os.path.join(application_path, relative_path)
+    user_file_path = os.path.join(_APP_DIR, relative_path)
     if os.path.exists(user_file_path):
+        _resolved_resource_paths[relative_path] = user_file_path
         return user_file_path
 
     # Fall back to bundled resource for frozen apps
-    if getattr(sys, 'frozen', False):
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = getattr(sys, '_MEIPASS', application_path)
-        return os.path.join(base_path, relative_path)
+    if _IS_FROZEN:
+        return os.path.join(_MEIPASS, relative_path)
 
     # For development, return the normal path
     return user_file_path
 
 
+@lru_cache(maxsize=None)
 def get_writable_path(relative_path: str) -> str:
     """
     Get writable path for user data files.
@@ -55,14 +68,7 @@ def get_writable_path(relative_path: str) -> str:
     Returns:
         Absolute writable path
     """
-    if getattr(sys, 'frozen', False):
-        # Running as compiled executable
-        application_path = os.path.dirname(sys.executable)
-    else:
-        # Running as script
-        application_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
-    return os.path.join(application_path, relative_path)
+    return os.path.join(_APP_DIR, relative_path)
 
 # Application Information
 APP_NAME = "Torchlight Price Checker"
@@ -83,11 +89,36 @@ LOG_FILE_RELATIVE_PATH = "../../../TorchLight/Saved/Logs/UE_game.log"
 PATTERN_PRICE_ID = r'XchgSearchPrice----SynId = (\d+).*?\+refer \[(\d+)\]'
 PATTERN_BAG_MODIFY = r'\[.*?\]GameLog: Display: \[Game\] BagMgr@:Modfy BagItem PageId = (\d+) SlotId = (\d+) ConfigBaseId = (\d+) Num = (\d+)'
 PATTERN_BAG_INIT = r'\[.*?\]GameLog: Display: \[Game\] BagMgr@:InitBagData PageId = (\d+) SlotId = (\d+) ConfigBaseId = (\d+) Num = (\d+)'
+# Both bag events in one pass; the "op" group tells them apart
+BAG_OP_INIT = "InitBagData"
+BAG_OP_MODIFY = "Modfy BagItem"  # (sic) spelled as in the game log
+PATTERN_BAG = r'\[.*?\]GameLog: Display: \[Game\] BagMgr@:(?P<op>Modfy BagItem|InitBagData) PageId = (\d+) SlotId = (\d+) ConfigBaseId = (\d+) Num = (\d+)'
+PATTERN_PRICE_VALUE = r'\+\d+\s+\[([\d.]+)\]'
 PATTERN_MAP_ENTER = r"PageApplyBase@ _UpdateGameEnd: LastSceneName = World'/Game/Art/Maps/01SD/XZ_YuJinZhiXiBiNanSuo200/XZ_YuJinZhiXiBiNanSuo200.XZ_YuJinZhiXiBiNanSuo200' NextSceneName = World'/Game/Art/Maps"
 PATTERN_MAP_EXIT = r"NextSceneName = World'/Game/Art/Maps/01SD/XZ_YuJinZhiXiBiNanSuo200/XZ_YuJinZhiXiBiNanSuo200.XZ_YuJinZhiXiBiNanSuo200'"
 
+# Compiled once at import and shared by every parser instance and worker thread
+RE_PRICE_ID = re.compile(PATTERN_PRICE_ID, re.DOTALL)
+RE_PRICE_VALUE = re.compile(PATTERN_PRICE_VALUE)
+RE_BAG = re.compile(PATTERN_BAG)
+RE_MAP_ENTER = re.compile(PATTERN_MAP_ENTER)
+RE_MAP_EXIT = re.compile(PATTERN_MAP_EXIT)
+
+# Literal markers delimiting price search responses in the log
+PRICE_SEARCH_MARKER = 'XchgSearchPrice----SynId = '  # Present in every PATTERN_PRICE_ID match
+PRICE_RECV_MARKER = '----Socket RecvMessage STT----'
+PRICE_RECV_HEADER = PRICE_RECV_MARKER + PRICE_SEARCH_MARKER
+
+# Literal present in every PATTERN_BAG match (used as a cheap pre-filter)
+BAG_EVENT_MARKER = "BagMgr@:"
+
+# Hideout scene name present on every map enter/exit log line (used as a cheap pre-filter)
+MAP_HIDEOUT_SCENE = "XZ_YuJinZhiXiBiNanSuo200"
+
 # Item Types
-ITEM_TYPES: List[str] = [
+# Read-only by convention: ordered for display, see ITEM_TYPES_SET for membership tests
+# Interned so that types parsed from the item table (also interned on load) compare by identity
+ITEM_TYPES: Tuple[str, ...] = tuple(map(sys.intern, (
     "Compass",
     "Currency",
     "Special Item",
@@ -115,14 +146,16 @@ ITEM_TYPES: List[str] = [
     "Overlay Material",
     "Remembrance Material",
     "Hard Currency"
-]
-
-# Item Type Filters
-FILTER_CURRENCY = ["Currency", "Hard Currency"]
-FILTER_ASHES = ["Equipment Material", "Ashes"]
-FILTER_COMPASS = ["Compass"]
-FILTER_GLOW = ["Memory Glow", "Memory Fluorescence"]
-FILTER_OTHERS = [
+)))
+ITEM_TYPES_SET: FrozenSet[str] = frozenset(ITEM_TYPES)  # For membership tests; ITEM_TYPES keeps display order
+ITEM_TYPE_ORDER: Dict[str, int] = {item_type: index for index, item_type in enumerate(ITEM_TYPES)}  # Sort key by display order
+
+# Item Type Filters (frozen for constant-time membership tests, interned like ITEM_TYPES)
+FILTER_CURRENCY: FrozenSet[str] = frozenset(map(sys.intern, ("Currency", "Hard Currency")))
+FILTER_ASHES: FrozenSet[str] = frozenset(map(sys.intern, ("Equipment Material", "Ashes")))
+FILTER_COMPASS: FrozenSet[str] = frozenset(map(sys.intern, ("Compass",)))
+FILTER_GLOW: FrozenSet[str] = frozenset(map(sys.intern, ("Memory Glow", "Memory Fluorescence")))
+FILTER_OTHERS: FrozenSet[str] = frozenset(map(sys.intern, (
     "Special Item",
     "Memory Material",
     "Gameplay Ticket",
@@ -144,7 +177,7 @@ FILTER_OTHERS = [
     "Overlap Material",
     "Overlay Material",
     "Remembrance Material"
-]
+)))
 
 # UI Configuration
 UI_FONT_FAMILY = "Arial"
@@ -172,16 +205,23 @@ MIN_BAG_ITEMS_LEGACY = 10
 
 # Threading Configuration
 LOG_POLL_INTERVAL = 1.0  # seconds
+CONFIG_SAVE_DELAY = 0.25  # seconds - Debounce for writing setting changes to config.json
 
 # API Configuration
 API_CACHE_TTL = 3600  # seconds - How long to cache API responses (matches API_UPDATE_THROTTLE)
-API_RETRY_BASE_DELAY = 2  # seconds - Base delay for exponential backoff
+API_RETRY_BACKOFF_FACTOR = 1  # seconds - urllib3 backoff factor (waits 1s, 2s, 4s... between retries)
+API_RETRY_STATUS_CODES = (408, 429, 500, 502, 503, 504)  # Responses worth retrying
+API_POOL_CONNECTIONS = 4  # Number of per-host connection pools kept by the session
+API_POOL_MAXSIZE = 16  # Maximum pooled keep-alive connections per host
 API_UPDATE_THROTTLE = 3600  # seconds - Minimum time between API updates for same item (1 hour)
 API_RATE_LIMIT_CALLS = 100  # Maximum API calls per window
 API_RATE_LIMIT_WINDOW = 60  # seconds - Rate limit window duration
+API_SYNC_MAX_WORKERS = 8  # Maximum concurrent requests during a bulk sync
 
 # File Handle Configuration
 LOG_FILE_REOPEN_INTERVAL = 30.0  # seconds - How often to check if log file needs reopening
+DROP_LOG_FLUSH_INTERVAL = 5.0  # seconds - Maximum time drop log lines stay buffered
+DROP_LOG_FLUSH_LINES = 20  # Flush the drop log after this many buffered lines
 
 # UI Configuration - Additional
 UI_LISTBOX_ITEM_HEIGHT = 20  # pixels - Approximate height per list item
@@ -189,6 +229,8 @@ UI_MIN_WINDOW_WIDTH = 400
 UI_MIN_WINDOW_HEIGHT = 600
 UI_DEFAULT_WINDOW_WIDTH = 500
 UI_DEFAULT_WINDOW_HEIGHT = 800
+UI_RESHOW_DELAY_MS = 100  # milliseconds - Window for coalescing drop list refreshes
+UI_GEOMETRY_SAVE_DELAY_MS = 250  # milliseconds - Debounce for saving window geometry while moving/resizing
 
 # UI Color Palette
 UI_COLORS = {
@@ -223,6 +265,10 @@ DEFAULT_CONFIG = {
 }
 
 
+# Per-item tax multipliers when tax is enabled; items not listed pay TAX_RATE
+_TAX_MULTIPLIERS: Dict[str, float] = {EXCLUDED_ITEM_ID: 1.0}
+
+
 def calculate_price_with_tax(price: float, item_id: str, tax_enabled: bool) -> float:
     """
     Calculate item price with tax applied if enabled.
@@ -235,9 +281,9 @@ def calculate_price_with_tax(price: float, item_id: str, tax_enabled: bool) -> f
     Returns:
         Price with tax applied if applicable
     """
-    if tax_enabled and item_id != EXCLUDED_ITEM_ID:
-        return price * TAX_RATE
-    return price
+    if not tax_enabled:
+        return price
+    return price * _TAX_MULTIPLIERS.get(item_id, TAX_RATE)
 
 
 def format_duration(seconds: float) -> str:
@@ -250,34 +296,52 @@ def format_duration(seconds: float) -> str:
     Returns:
         Formatted string like "2h 30m 45s" or "5m 12s"
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
 
     if hours > 0:
         return f"{hours}h {minutes}m {secs}s"
     return f"{minutes}m {secs}s"
 
 
-def get_price_freshness_status(last_update: float, current_time: float) -> str:
+# (status, indicator) pairs returned by get_price_freshness
+_FRESHNESS_FRESH = ("Fresh", STATUS_FRESH)
+_FRESHNESS_STALE = ("Stale", STATUS_STALE)
+_FRESHNESS_OLD = ("Old", STATUS_OLD)
+
+
+def get_price_freshness(last_update: float, current_time: float) -> Tuple[str, str]:
     """
-    Determine the freshness status of a price based on last update time.
+    Classify price freshness once, for callers that need the status and the indicator.
 
     Args:
         last_update: Timestamp of last price update
         current_time: Current timestamp
 
     Returns:
-        Status string: "Fresh", "Stale", or "Old"
+        Tuple of (status, indicator), e.g. ("Fresh", STATUS_FRESH)
     """
     time_passed = current_time - last_update
 
     if time_passed < TIME_FRESH_THRESHOLD:
-        return "Fresh"
-    elif time_passed < TIME_STALE_THRESHOLD:
-        return "Stale"
-    else:
-        return "Old"
+        return _FRESHNESS_FRESH
+    if time_passed < TIME_STALE_THRESHOLD:
+        return _FRESHNESS_STALE
+    return _FRESHNESS_OLD
+
+
+def get_price_freshness_status(last_update: float, current_time: float) -> str:
+    """
+    Determine the freshness status of a price based on last update time.
+
+    Args:
+        last_update: Timestamp of last price update
+        current_time: Current timestamp
+
+    Returns:
+        Status string: "Fresh", "Stale", or "Old"
+    """
+    return get_price_freshness(last_update, current_time)[0]
 
 
 def get_price_freshness_indicator(last_update: float, current_time: float) -> str:
@@ -291,14 +355,7 @@ def get_price_freshness_indicator(last_update: float, current_time: float) -> st
     Returns:
         Status indicator: STATUS_FRESH, STATUS_STALE, or STATUS_OLD
     """
-    time_passed = current_time - last_update
-
-    if time_passed < TIME_FRESH_THRESHOLD:
-        return STATUS_FRESH
-    elif time_passed < TIME_STALE_THRESHOLD:
-        return STATUS_STALE
-    else:
-        return STATUS_OLD
+    return get_price_freshness(last_update, current_time)[1]
 
 
 def calculate_fe_per_hour(income: float, duration: float) -> float:
@@ -3,50 +3,113 @@ File management utilities for the Torchlight Infinite Price Tracker.
 Handles reading and writing JSON files with proper error handling.
 """
 
+import atexit
 import json
 import logging
+import mmap
+import os
+import sys
+import threading
 import time
-from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, Optional
+from collections import deque
+from functools import cached_property, lru_cache
+from typing import Any, Deque, Dict, List, Optional, TextIO, Tuple
 
 from .api_client import APIClient
 from .constants import (
     API_UPDATE_THROTTLE,
     CONFIG_FILE,
     DROP_LOG_FILE,
+    DROP_LOG_FLUSH_INTERVAL,
+    DROP_LOG_FLUSH_LINES,
     EN_ID_TABLE_FILE,
     FULL_TABLE_FILE,
     get_resource_path,
     get_writable_path,
 )
+from .json_utils import ORJSON_AVAILABLE, atomic_write_bytes, json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
 
+def _intern_item_types(table: Dict[str, Any]) -> None:
+    """
+    Intern the type string of every item in place.
+
+    Types parsed from JSON are fresh string objects; interning them makes the
+    filter lookups against the (interned) ITEM_TYPES constants hit on identity
+    instead of comparing characters.
+
+    Args:
+        table: Full item table to update.
+    """
+    intern = sys.intern
+    for entry in table.values():
+        item_type = entry.get("type")
+        if isinstance(item_type, str):
+            entry["type"] = intern(item_type)
+
+
+@lru_cache(maxsize=1024)
+def _unknown_name(item_id: str) -> str:
+    """
+    Build the placeholder name for an item missing from the table.
+
+    Cached because untracked items keep reappearing in the log until their
+    entry is added, and each lookup would otherwise format a new string.
+
+    Args:
+        item_id: Item ID that was not found.
+
+    Returns:
+        Placeholder item name.
+    """
+    return f"Unknown item (ID: {item_id})"
+
+
 class FileManager:
     """Manages file I/O operations with proper error handling and caching."""
 
     def __init__(self):
         """Initialize the file manager."""
         self._full_table_cache: Optional[Dict[str, Any]] = None
-        self._cache_timestamp: float = 0
-
-        # Load configuration
-        self.config = self._load_config()
-
-        # Initialize API client if enabled
-        self.api_client: Optional[APIClient] = None
-        if self.config.get('api_enabled', False):
-            api_url = self.config.get('api_url', '')
-            api_timeout = self.config.get('api_timeout', 10)
-            if api_url:
-                self.api_client = APIClient(api_url, timeout=api_timeout)
-                logger.info(f"API client initialized with URL: {api_url}")
-            else:
-                logger.warning("API enabled but no URL configured")
-
-        self.use_local_fallback = self.config.get('use_local_fallback', True)
+        # (mtime_ns, size) of full_table.json when the cache was read from it
+        # (None when the cached table came from the API)
+        self._full_table_signature: Optional[Tuple[int, int]] = None
+
+        # Drop log lines are buffered in memory and written in batches to a
+        # file that stays open between flushes
+        self._drop_log: Optional[TextIO] = None
+        self._drop_log_buffer: Deque[str] = deque()
+        self._drop_log_lock = threading.Lock()
+        self._drop_log_last_flush = time.monotonic()
+        # Formatted timestamp for the last wall-clock second a line was logged in
+        self._drop_log_ts_second = -1
+        self._drop_log_ts = ""
+        self._drop_log_atexit_registered = False
+
+    @cached_property
+    def config(self) -> Dict[str, Any]:
+        """Configuration dictionary, read from config.json on first access."""
+        return self._load_config()
+
+    @cached_property
+    def api_client(self) -> Optional[APIClient]:
+        """API client, created on first access, or None if the API is disabled."""
+        if not self.config.get('api_enabled', False):
+            return None
+        api_url = self.config.get('api_url', '')
+        if not api_url:
+            logger.warning("API enabled but no URL configured")
+            return None
+        api_timeout = self.config.get('api_timeout', 10)
+        logger.info(f"API client initialized with URL: {api_url}")
+        return APIClient(api_url, timeout=api_timeout)
+
+    @cached_property
+    def use_local_fallback(self) -> bool:
+        """Whether to read the local file when the API fails."""
+        return self.config.get('use_local_fallback', True)
 
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -59,35 +122,12 @@ class FileManager:
         try:
             config_path = get_resource_path(CONFIG_FILE)
             logger.info(f"Loading config from: {config_path}")
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(config_path, 'rb') as f:
+                return json_loads(f.read())
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.warning(f"Could not load config: {e}, using defaults")
             return {}
 
-    def ensure_file_exists(self, filepath: str, default_content: Any) -> None:
-        """
-        Ensure a file exists, creating it with default content if it doesn't.
-        Uses writable path to ensure file can be created next to executable.
-
-        Args:
-            filepath: Path to the file.
-            default_content: Default content to write if file doesn't exist.
-        """
-        # Check both user location and bundled location
-        writable_path = get_writable_path(filepath)
-        resource_path = get_resource_path(filepath)
-
-        # If file doesn't exist in either location, create it in writable location
-        if not Path(writable_path).exists() and not Path(resource_path).exists():
-            logger.info(f"Creating file: {writable_path}")
-            try:
-                with open(writable_path, 'w', encoding='utf-8') as f:
-                    json.dump(default_content, f, ensure_ascii=False, indent=4)
-            except IOError as e:
-                logger.error(f"Failed to create file {writable_path}: {e}")
-                raise
-
     def load_json(self, filepath: str, default: Any = None) -> Any:
         """
         Load JSON data from a file.
@@ -104,22 +144,19 @@ class FileManager:
         default_value = default if default is not None else {}
 
         try:
-            with open(resolved_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(resolved_path, 'rb') as f:
+                return json_loads(f.read())
         except FileNotFoundError:
             logger.warning(f"File not found: {filepath}")
             return default_value
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             logger.error(f"Invalid JSON in {filepath}: {e}", exc_info=True)
             return default_value
         except (IOError, OSError) as e:
             logger.error(f"Error reading {filepath}: {e}", exc_info=True)
             return default_value
-        except Exception as e:
-            logger.error(f"Unexpected error loading {filepath}: {e}", exc_info=True)
-            return default_value
 
-    def save_json(self, filepath: str, data: Any) -> bool:
+    def save_json(self, filepath: str, data: Any, pretty: bool = True, durable: bool = True) -> bool:
         """
         Save JSON data to a file.
         Always writes to writable location (next to executable).
@@ -127,14 +164,16 @@ class FileManager:
         Args:
             filepath: Path to the JSON file.
             data: Data to save.
+            pretty: Whether to indent the output. Pass False for machine-only files.
+            durable: Whether to fsync before replacing the file. Pass False for
+                files that are rewritten often and can be rebuilt.
 
         Returns:
             True if successful, False otherwise.
         """
         writable_path = get_writable_path(filepath)
         try:
-            with open(writable_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+            atomic_write_bytes(writable_path, json_dumps(data, pretty), durable)
             return True
         except (IOError, OSError) as e:
             logger.error(f"Error writing to {writable_path}: {e}", exc_info=True)
@@ -142,9 +181,75 @@ class FileManager:
         except (TypeError, ValueError) as e:
             logger.error(f"Error serializing data for {writable_path}: {e}", exc_info=True)
             return False
-        except Exception as e:
-            logger.error(f"Unexpected error saving {writable_path}: {e}", exc_info=True)
-            return False
+
+    def _read_full_table_file(self) -> Dict[str, Any]:
+        """
+        Read the local full item table from disk.
+        Memory-maps the file and parses it with orjson when available,
+        otherwise falls back to load_json.
+
+        The table parsed here is owned by the file manager, so its type
+        strings are interned in place. Tables from the API are left alone
+        because their entries are shared with the API client's cache.
+
+        Returns:
+            Full item table dictionary, or an empty dict on error.
+        """
+        if not ORJSON_AVAILABLE:
+            table = self.load_json(FULL_TABLE_FILE, {})
+            _intern_item_types(table)
+            return table
+
+        resolved_path = get_resource_path(FULL_TABLE_FILE)
+        try:
+            with open(resolved_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        table = json_loads(view)
+            _intern_item_types(table)
+            return table
+        except FileNotFoundError:
+            logger.warning(f"File not found: {FULL_TABLE_FILE}")
+            return {}
+        except ValueError as e:
+            # Covers orjson.JSONDecodeError and mmap of an empty file
+            logger.error(f"Invalid JSON in {FULL_TABLE_FILE}: {e}", exc_info=True)
+            return {}
+        except (IOError, OSError) as e:
+            logger.error(f"Error reading {FULL_TABLE_FILE}: {e}", exc_info=True)
+            return {}
+
+    def _get_full_table_signature(self) -> Tuple[int, int]:
+        """
+        Get a cheap change signature for the local full table file.
+
+        Comparing size as well as modification time catches rewrites that
+        land within the filesystem's timestamp granularity.
+
+        Returns:
+            Tuple of (modification time in nanoseconds, size in bytes),
+            or (0, 0) if the file does not exist.
+        """
+        try:
+            st = os.stat(get_resource_path(FULL_TABLE_FILE))
+        except OSError:
+            return (0, 0)
+        return (st.st_mtime_ns, st.st_size)
+
+    def _write_full_table_file(self, data: Dict[str, Any]) -> bool:
+        """
+        Write the full item table to disk.
+        The table is only read by the app, so it is written without indentation,
+        and it is rewritten on every price batch and can be rebuilt from the API
+        or en_id_table.json, so the write is not fsynced.
+
+        Args:
+            data: Full item table to write.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        return self.save_json(FULL_TABLE_FILE, data, pretty=False, durable=False)
 
     def load_full_table(self, use_cache: bool = True) -> Dict[str, Any]:
         """
@@ -158,31 +263,38 @@ class FileManager:
             Full item table dictionary.
         """
         if use_cache and self._full_table_cache is not None:
-            return self._full_table_cache
+            # Only re-read the local file when it has changed on disk
+            if self._full_table_signature is None or self._full_table_signature == self._get_full_table_signature():
+                return self._full_table_cache
+            logger.info(f"{FULL_TABLE_FILE} changed on disk, reloading")
 
         data = {}
+        file_signature: Optional[Tuple[int, int]] = self._get_full_table_signature()
 
         # Try API first if enabled
         if self.api_client:
             try:
                 api_data = self.api_client.get_all_items(use_cache=use_cache)
                 if api_data is not None:
+                    # The client hands out its own copy, so it can be mutated here
                     data = api_data
+                    file_signature = None
                     logger.debug("Loaded full table from API")
                 elif self.use_local_fallback:
                     logger.warning("API failed, falling back to local file")
-                    data = self.load_json(FULL_TABLE_FILE, {})
+                    data = self._read_full_table_file()
             except Exception as e:
                 logger.error(f"Error loading from API: {e}")
                 if self.use_local_fallback:
                     logger.warning("Falling back to local file")
-                    data = self.load_json(FULL_TABLE_FILE, {})
+                    data = self._read_full_table_file()
         else:
             # Use local file if API not enabled
-            data = self.load_json(FULL_TABLE_FILE, {})
+            data = self._read_full_table_file()
 
         if use_cache:
             self._full_table_cache = data
+            self._full_table_signature = file_signature
         return data
 
     def save_full_table(self, data: Dict[str, Any]) -> bool:
@@ -197,17 +309,24 @@ class FileManager:
             True if successful, False otherwise.
         """
         # Save to local file
-        success = self.save_json(FULL_TABLE_FILE, data)
+        success = self._write_full_table_file(data)
 
         # Update cache if successful
         if success:
             self._full_table_cache = data
+            self._full_table_signature = self._get_full_table_signature()
 
         return success
 
     def invalidate_cache(self) -> None:
-        """Invalidate the cached full table data."""
+        """
+        Invalidate the cached full table data.
+
+        Local edits to full_table.json are picked up automatically via its
+        mtime/size signature; this is only needed to force a fresh API fetch.
+        """
         self._full_table_cache = None
+        self._full_table_signature = None
         if self.api_client:
             self.api_client.invalidate_cache()
         logger.debug("Cache invalidated")
@@ -227,50 +346,119 @@ class FileManager:
             updates: Dictionary of fields to update.
 
         Returns:
-            True if successful, False otherwise.
+            True if the item was updated or was already fresh, False if it is unknown.
+        """
+        return item_id in self.update_items({item_id: updates})
+
+    def update_items(
+        self,
+        updates_by_id: Dict[str, Dict[str, Any]],
+        now: Optional[float] = None
+    ) -> List[str]:
+        """
+        Update several items in the table at once.
+        Applies the same staleness rules as update_item(), but sends the API
+        requests for the whole batch concurrently and writes the file once.
+
+        Args:
+            updates_by_id: Dictionary of {item_id: fields to update}.
+            now: Current time for the staleness check. Defaults to time.time().
+
+        Returns:
+            IDs of the items that were updated or were already fresh, in input
+            order. Updates stay applied in memory even if the file write fails.
         """
-        # Load current local data
         full_table = self.load_full_table(use_cache=True)
+        current_time = time.time() if now is None else now
+
+        accepted: List[str] = []
+        pending: Dict[str, Dict[str, Any]] = {}
+        for item_id, updates in updates_by_id.items():
+            current_item = full_table.get(item_id)
+            if current_item is None:
+                logger.warning(f"Item {item_id} not found in table")
+                continue
+            accepted.append(item_id)
+            if self._needs_update(item_id, current_item, updates, current_time):
+                pending[item_id] = updates
+
+        if not pending:
+            return accepted
+
+        # If API is enabled, send the PUT requests together
+        if self.api_client:
+            try:
+                results = self.api_client.update_items(pending)
+                failed = [item_id for item_id, updated in results.items() if not updated]
+                logger.info(f"Updated {len(results) - len(failed)} items via API")
+                if failed:
+                    logger.warning(f"Failed to update items {', '.join(failed)} via API, updating locally only")
+            except Exception as e:
+                logger.error(f"Error updating items via API: {e}, updating locally only")
+
+        # full_table is the cached table itself, so this updates the cache too
+        for item_id, updates in pending.items():
+            full_table[item_id].update(updates)
+
+        if not self._save_cached_full_table(full_table):
+            logger.warning(f"Could not save {len(pending)} updated items to {FULL_TABLE_FILE}; the changes are kept in memory only")
+        return accepted
+
+    def _needs_update(
+        self,
+        item_id: str,
+        current_item: Dict[str, Any],
+        updates: Dict[str, Any],
+        current_time: float
+    ) -> bool:
+        """
+        Decide whether an item's local data is stale enough to be updated.
 
-        if item_id not in full_table:
-            logger.warning(f"Item {item_id} not found in table")
-            return False
+        Logic:
+        - If < 1 hour old: Skip update entirely (data is fresh enough)
+        - If nothing would change: Skip, there is nothing to send or write
+        - Otherwise the item should be sent to the API and updated locally
 
-        # Check if local data is stale (>1 hour old)
-        current_item = full_table[item_id]
-        local_last_update = current_item.get('last_update', 0)
-        current_time = time.time()
-        time_since_update = current_time - local_last_update
+        Args:
+            item_id: The item ID.
+            current_item: The item's current entry in the full table.
+            updates: Dictionary of fields to update.
+            current_time: Current time for the staleness check.
+
+        Returns:
+            True if the item should be updated, False to skip it.
+        """
+        time_since_update = current_time - current_item.get('last_update', 0)
 
         # If data is fresh (< 1 hour old), skip update entirely
         if time_since_update < API_UPDATE_THROTTLE:
             logger.debug(f"Skipping update for item {item_id}: local data is fresh ({time_since_update:.0f}s old)")
-            return True  # Not an error, just skipping
+            return False
+
+        # Nothing would change, so there is nothing to send or write
+        if all(current_item.get(key) == value for key, value in updates.items()):
+            logger.debug(f"Skipping update for item {item_id}: no changes")
+            return False
 
         # Data is stale (> 1 hour old), proceed with update
         logger.info(f"Updating item {item_id}: local data is stale ({time_since_update:.0f}s old)")
+        return True
 
-        # If API is enabled, send PUT request
-        if self.api_client:
-            try:
-                updated = self.api_client.update_item(item_id, updates)
-                if updated:
-                    logger.info(f"Updated item {item_id} via API")
-                else:
-                    logger.warning(f"Failed to update item {item_id} via API, updating locally only")
-            except Exception as e:
-                logger.error(f"Error updating item via API: {e}, updating locally only")
-
-        # Update local file and cache
-        full_table[item_id].update(updates)
-
-        # Update cache
-        if self._full_table_cache and item_id in self._full_table_cache:
-            self._full_table_cache[item_id].update(updates)
+    def _save_cached_full_table(self, full_table: Dict[str, Any]) -> bool:
+        """
+        Write the cached full table to file after it was modified in place.
 
-        # Save to file
-        return self.save_json(FULL_TABLE_FILE, full_table)
+        Args:
+            full_table: The cached full table.
 
+        Returns:
+            True if successful, False otherwise.
+        """
+        # Save to file, keeping the cache in step with our own write
+        success = self._write_full_table_file(full_table)
+        if success and self._full_table_signature is not None:
+            self._full_table_signature = self._get_full_table_signature()
+        return success
 
     def initialize_full_table_from_en_table(self) -> bool:
         """
@@ -280,9 +468,7 @@ class FileManager:
         Returns:
             True if initialization was performed, False otherwise.
         """
-        full_table_path = Path(get_writable_path(FULL_TABLE_FILE))
-
-        if full_table_path.exists():
+        if os.path.exists(get_writable_path(FULL_TABLE_FILE)):
             logger.debug("full_table.json already exists")
             return False
 
@@ -299,8 +485,7 @@ class FileManager:
                 logger.warning(f"Could not load from API: {e}, falling back to en_id_table.json")
 
         # Fallback: create from en_id_table.json
-        en_table_path = Path(get_resource_path(EN_ID_TABLE_FILE))
-        if not en_table_path.exists():
+        if not os.path.exists(get_resource_path(EN_ID_TABLE_FILE)):
             logger.warning(f"{EN_ID_TABLE_FILE} not found, cannot initialize full_table")
             return False
 
@@ -330,20 +515,78 @@ class FileManager:
 
     def append_to_drop_log(self, message: str) -> None:
         """
-        Append a message to the drop log file with timestamp.
-        Writes to writable location.
+        Append a message to the drop log with timestamp.
+
+        The line is buffered in memory and written together with the rest of
+        the buffer once DROP_LOG_FLUSH_LINES lines are pending or
+        DROP_LOG_FLUSH_INTERVAL seconds have passed since the last write,
+        whichever comes first.
 
         Args:
             message: Message to append.
         """
+        second = int(time.time())
+        if second != self._drop_log_ts_second:
+            self._drop_log_ts_second = second
+            self._drop_log_ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        self._drop_log_buffer.append(f"[{self._drop_log_ts}] {message}\n")
+
+        # Only instances that actually log drops need flushing at exit
+        if not self._drop_log_atexit_registered:
+            self._drop_log_atexit_registered = True
+            atexit.register(self.close_drop_log)
+
+        self.flush_drop_log(force=len(self._drop_log_buffer) >= DROP_LOG_FLUSH_LINES)
+
+    def flush_drop_log(self, force: bool = False) -> None:
+        """
+        Write buffered drop log lines to the file in a single write.
+        Writes to writable location.
+
+        Cheap to call often: returns immediately when nothing is buffered or,
+        unless forced, when the last flush was less than
+        DROP_LOG_FLUSH_INTERVAL seconds ago.
+
+        Args:
+            force: Flush regardless of the interval.
+        """
+        if not self._drop_log_buffer:
+            return
+        now = time.monotonic()
+        if not force and now - self._drop_log_last_flush < DROP_LOG_FLUSH_INTERVAL:
+            return
+
+        with self._drop_log_lock:
+            buffer = self._drop_log_buffer
+            lines = [buffer.popleft() for _ in range(len(buffer))]
+            if not lines:
+                return
+            self._drop_log_last_flush = now
+            try:
+                if self._drop_log is None:
+                    self._drop_log = open(get_writable_path(DROP_LOG_FILE), 'a', encoding='utf-8')
+                self._drop_log.write("".join(lines))
+                self._drop_log.flush()
+            except IOError as e:
+                logger.error(f"Error writing to drop log ({len(lines)} lines lost): {e}")
+                self._close_drop_log_file()
+
+    def close_drop_log(self) -> None:
+        """Flush buffered lines and close the drop log file if it is open."""
+        self.flush_drop_log(force=True)
+        with self._drop_log_lock:
+            self._close_drop_log_file()
+
+    def _close_drop_log_file(self) -> None:
+        """Close the drop log file handle. Must be called with _drop_log_lock held."""
+        if self._drop_log is None:
+            return
         try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            log_line = f"[{timestamp}] {message}\n"
-            drop_log_path = get_writable_path(DROP_LOG_FILE)
-            with open(drop_log_path, 'a', encoding='utf-8') as f:
-                f.write(log_line)
+            self._drop_log.close()
         except IOError as e:
-            logger.error(f"Error writing to drop log: {e}")
+            logger.error(f"Error closing drop log: {e}")
+        finally:
+            self._drop_log = None
 
     def get_item_name(self, item_id: str, full_table: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -359,9 +602,12 @@ class FileManager:
         if full_table is None:
             full_table = self.load_full_table()
 
-        if item_id in full_table:
-            return full_table[item_id].get("name", f"Unknown item (ID: {item_id})")
-        return f"Unknown item (ID: {item_id})"
+        entry = full_table.get(item_id)
+        if entry is not None:
+            name = entry.get("name")
+            if name is not None:
+                return name
+        return _unknown_name(item_id)
 
     def get_item_price(self, item_id: str, full_table: Optional[Dict[str, Any]] = None) -> float:
         """
@@ -377,6 +623,21 @@ class FileManager:
         if full_table is None:
             full_table = self.load_full_table()
 
-        if item_id in full_table:
-            return full_table[item_id].get("price", 0.0)
+        entry = full_table.get(item_id)
+        if entry is not None:
+            return entry.get("price", 0.0)
         return 0.0
+
+
+@lru_cache(maxsize=None)
+def get_file_manager() -> FileManager:
+    """
+    Get the process-wide FileManager instance, creating it on first use.
+
+    Sharing one instance means every caller reuses the same cached item table
+    and invalidating it affects all of them.
+
+    Returns:
+        Shared FileManager instance.
+    """
+    return FileManager()
@@ -4,26 +4,70 @@ Handles finding the game process and log file.
 """
 
 import logging
-import os
-from typing import Optional, Tuple, Any
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
-# Import Windows-specific modules with proper fallbacks
+from .constants import GAME_WINDOW_TITLE, LOG_FILE_RELATIVE_PATH
+
+# Windows-specific modules, imported with proper fallbacks on first use
 WINDOWS_MODULES_AVAILABLE = False
 win32gui: Any = None
 win32process: Any = None
 psutil: Any = None
-
-try:
-    import win32gui  # type: ignore
-    import win32process  # type: ignore
-    import psutil  # type: ignore
-    WINDOWS_MODULES_AVAILABLE = True
-except ImportError:
-    pass
+_windows_modules_loaded = False
 
 logger = logging.getLogger(__name__)
 
 
+def _load_windows_modules() -> bool:
+    """
+    Import the Windows-specific modules the first time game detection runs.
+
+    psutil and pywin32 are only needed by the detector, so deferring them keeps
+    their import cost out of importing this module. The app calls detect_game()
+    at startup, so this only helps code that imports the module without
+    detecting the game.
+
+    Returns:
+        True if the modules are available, False otherwise.
+    """
+    global WINDOWS_MODULES_AVAILABLE, win32gui, win32process, psutil, _windows_modules_loaded
+    if not _windows_modules_loaded:
+        _windows_modules_loaded = True
+        try:
+            import win32gui  # type: ignore
+            import win32process  # type: ignore
+            import psutil  # type: ignore
+            WINDOWS_MODULES_AVAILABLE = True
+        except ImportError:
+            pass
+    return WINDOWS_MODULES_AVAILABLE
+
+
+# Window titles mentioning the game that belong to other apps (Discord, browsers, etc.)
+_EXCLUDED_TITLE_RE = re.compile(r"discord|chrome|firefox|edge|browser|twitch|youtube")
+
+# Drops the BOM and line breaks from the log preview before it is logged
+_PREVIEW_CLEANUP = str.maketrans({'\ufeff': None, '\r': None, '\n': ' '})
+
+# Exact titles the game window is known to use, tried with FindWindow before enumerating
+_KNOWN_WINDOW_TITLES = (GAME_WINDOW_TITLE, GAME_WINDOW_TITLE.rstrip())
+
+
+def _is_game_process_name(exe_name: str) -> bool:
+    """
+    Check whether a lowercased executable name looks like the game's.
+
+    The game executable should be something like "TorchLight.exe" or similar,
+    so accept names containing "torchlight" or starting with "tl".
+    """
+    return "torchlight" in exe_name or exe_name.startswith("tl")
+
+
+class _WindowFound(Exception):
+    """Raised from the EnumWindows callback to stop enumeration at the game window."""
+
+
 class GameDetector:
     """Detects the Torchlight: Infinite game and locates its log file."""
 
@@ -32,21 +76,179 @@ class GameDetector:
         self.game_found = False
         self.log_file_path: Optional[str] = None
         self.game_exe_path: Optional[str] = None
+        # Last game window found and its process, revalidated before reuse
+        self._cached_hwnd: Optional[int] = None
+        self._cached_pid: Optional[int] = None
+
+    def _is_cached_window_valid(self) -> bool:
+        """
+        Check whether the cached game window still belongs to the game.
+
+        Window handles are recycled, so the handle must still exist, be
+        visible and be owned by the same process it was found in.
+
+        Returns:
+            True if the cached window can be reused, False otherwise.
+        """
+        hwnd = self._cached_hwnd
+        if hwnd is None:
+            return False
+        try:
+            if not win32gui.IsWindow(hwnd) or not win32gui.IsWindowVisible(hwnd):
+                return False
+            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            return pid == self._cached_pid
+        except Exception:
+            return False
+
+    def _invalidate_window_cache(self) -> None:
+        """Forget the cached game window and process."""
+        self._cached_hwnd = None
+        self._cached_pid = None
+
+    def _get_game_pid(
+        self,
+        hwnd: int,
+        window_title: str,
+        process_names: Optional[Dict[int, Optional[str]]] = None
+    ) -> Optional[int]:
+        """
+        Verify that a window belongs to the game by its process executable name.
+
+        Args:
+            hwnd: Window handle to check.
+            window_title: Title of the window, for logging.
+            process_names: Optional memo of lowercased executable names by PID
+                (None for inaccessible processes), shared across the windows of
+                one enumeration since a process often owns several windows.
+
+        Returns:
+            Process ID of the game if the window is the game's, None otherwise.
+        """
+        try:
+            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+        except Exception as e:
+            logger.debug(f"Cannot get process for window '{window_title}': {e}")
+            return None
+
+        if process_names is not None and pid in process_names:
+            exe_name = process_names[pid]
+        else:
+            try:
+                # name() is the executable's file name, and unlike exe() does not
+                # need to query the full image path of the process
+                exe_name = psutil.Process(pid).name().lower()
+            except Exception as e:
+                # Process may have terminated or we don't have permission to access it
+                # Using broad Exception to catch psutil errors, OSError, and any Windows API errors
+                logger.debug(f"Cannot access process for window '{window_title}': {e}")
+                exe_name = None
+            if process_names is not None:
+                process_names[pid] = exe_name
+
+        if exe_name is None:
+            return None
+
+        if _is_game_process_name(exe_name):
+            logger.info(f"Found game window with title: '{window_title}' (process: {exe_name})")
+            return pid
+
+        logger.debug(f"Window title matches but process doesn't: '{window_title}' (process: {exe_name})")
+        return None
+
+    def _find_game_process_ids(self, process_names: Dict[int, Optional[str]]) -> Optional[List[int]]:
+        """
+        List the processes whose executable name looks like the game's.
+
+        One pass over the process list is much shorter than a walk over every
+        top-level window, and the names it reads are recorded in process_names
+        so the window callback does not look them up again.
+
+        Args:
+            process_names: Memo of lowercased executable names by PID to fill.
+
+        Returns:
+            List of candidate PIDs, or None if the process list could not be read.
+        """
+        try:
+            candidate_pids = []
+            for process in psutil.process_iter(['name']):
+                name = process.info['name']
+                exe_name = name.lower() if name else None
+                process_names[process.pid] = exe_name
+                if exe_name and _is_game_process_name(exe_name):
+                    candidate_pids.append(process.pid)
+            return candidate_pids
+        except Exception as e:
+            logger.debug(f"Cannot list processes, enumerating all windows instead: {e}")
+            return None
+
+    def _enum_process_windows(self, pid: int, callback: Any) -> None:
+        """
+        Run an EnumWindows-style callback over the top-level windows of one process.
+
+        Args:
+            pid: Process whose threads' windows to enumerate.
+            callback: Window callback, which may raise _WindowFound to stop.
+        """
+        try:
+            threads = psutil.Process(pid).threads()
+        except Exception as e:
+            logger.debug(f"Cannot list threads of process {pid}: {e}")
+            return
+
+        for thread in threads:
+            try:
+                win32gui.EnumThreadWindows(thread.id, callback, None)
+            except _WindowFound:
+                raise
+            except Exception:
+                # Raised for threads that own no windows
+                continue
+
+    def _find_window_by_known_title(self) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Look the game window up by its exact title with FindWindow.
+
+        Returns:
+            Tuple of (hwnd, pid), or (None, None) if no known title matched.
+        """
+        for title in _KNOWN_WINDOW_TITLES:
+            try:
+                hwnd = win32gui.FindWindow(None, title)
+            except Exception:
+                # Newer pywin32 versions raise instead of returning 0 when nothing matches
+                continue
+            if hwnd and win32gui.IsWindowVisible(hwnd):
+                pid = self._get_game_pid(hwnd, title)
+                if pid is not None:
+                    return hwnd, pid
+        return None, None
 
     def _find_game_window(self) -> Optional[int]:
         """
         Find the game window by searching for windows containing 'Torchlight: Infinite'.
+        Known exact titles are tried first. Otherwise only the windows of
+        processes named like the game are searched, and all top-level windows
+        are only enumerated when the process list is unavailable. A match is
+        cached together with its process ID.
 
         Returns:
             Window handle (hwnd) if found, None otherwise.
         """
-        if not WINDOWS_MODULES_AVAILABLE:
+        if not _load_windows_modules():
             return None
 
-        found_hwnd: Optional[int] = None
+        found_hwnd, found_pid = self._find_window_by_known_title()
+        if found_hwnd is not None:
+            self._cached_hwnd = found_hwnd
+            self._cached_pid = found_pid
+            return found_hwnd
+
+        process_names: Dict[int, Optional[str]] = {}
 
         def enum_windows_callback(hwnd: int, _: Any) -> bool:
-            nonlocal found_hwnd
+            nonlocal found_hwnd, found_pid
             try:
                 # Extra safety check for modules
                 if not WINDOWS_MODULES_AVAILABLE:
@@ -61,42 +263,41 @@ class GameDetector:
                 # Search for "Torchlight: Infinite" in window title
                 if "torchlight: infinite" in window_title_lower:
                     # Exclude false positives (Discord, browsers, etc.)
-                    excluded_keywords = ["discord", "chrome", "firefox", "edge", "browser", "twitch", "youtube"]
-                    if any(keyword in window_title_lower for keyword in excluded_keywords):
+                    if _EXCLUDED_TITLE_RE.search(window_title_lower):
                         logger.debug(f"Skipping excluded window: '{window_title}'")
                         return True  # Continue enumeration
 
-                    # Verify the process executable name to ensure it's the actual game
-                    try:
-                        _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                        process = psutil.Process(pid)
-                        exe_name = os.path.basename(process.exe()).lower()
-
-                        # The game executable should be something like "TorchLight.exe" or similar
-                        # Accept if it contains "torchlight" or "tl" in the exe name
-                        if "torchlight" in exe_name or exe_name.startswith("tl"):
-                            logger.info(f"Found game window with title: '{window_title}' (process: {exe_name})")
-                            found_hwnd = hwnd
-                            return False  # Stop enumeration
-                        else:
-                            logger.debug(f"Window title matches but process doesn't: '{window_title}' (process: {exe_name})")
-                    except Exception as e:
-                        # Process may have terminated or we don't have permission to access it
-                        # Using broad Exception to catch psutil errors, OSError, and any Windows API errors
-                        logger.debug(f"Cannot access process for window '{window_title}': {e}")
-                        return True  # Continue enumeration
+                    pid = self._get_game_pid(hwnd, window_title, process_names)
+                    if pid is not None:
+                        found_hwnd = hwnd
+                        found_pid = pid
+                        # Returning False makes pywin32 raise a generic error, so abort
+                        # the walk with our own exception instead
+                        raise _WindowFound
 
+            except _WindowFound:
+                raise
             except Exception as e:
                 # Catch any other errors in the callback to prevent breaking EnumWindows
                 logger.debug(f"Error in window enumeration callback for hwnd {hwnd}: {e}")
 
             return True  # Continue enumeration
 
+        candidate_pids = self._find_game_process_ids(process_names)
+
         try:
-            win32gui.EnumWindows(enum_windows_callback, None)
+            if candidate_pids is None:
+                win32gui.EnumWindows(enum_windows_callback, None)
+            else:
+                for pid in candidate_pids:
+                    self._enum_process_windows(pid, enum_windows_callback)
+        except _WindowFound:
+            pass
         except Exception as e:
             logger.error(f"Error enumerating windows: {e}")
 
+        self._cached_hwnd = found_hwnd
+        self._cached_pid = found_pid
         return found_hwnd
 
     def detect_game(self) -> Tuple[bool, Optional[str]]:
@@ -106,7 +307,7 @@ class GameDetector:
         Returns:
             Tuple of (game_found, log_file_path).
         """
-        if not WINDOWS_MODULES_AVAILABLE:
+        if not _load_windows_modules():
             logger.warning("Windows modules (win32gui, psutil) not available. "
                           "Game detection will not work.")
             return False, None
@@ -118,29 +319,29 @@ class GameDetector:
                 logger.info("Game window not found")
                 return False, None
 
-            tid, pid = win32process.GetWindowThreadProcessId(hwnd)
-            process = psutil.Process(pid)
+            process = psutil.Process(self._cached_pid)
             exe_path = process.exe()
             self.game_exe_path = exe_path
 
             # Calculate log file path relative to game executable
             # Note: We concatenate directly to exe path (not dirname) to get correct relative navigation
-            log_path = exe_path + "/../../../TorchLight/Saved/Logs/UE_game.log"
+            log_path = exe_path + "/" + LOG_FILE_RELATIVE_PATH
             log_path = log_path.replace("\\", "/")
 
             # Verify log file exists and is readable
-            if not os.path.exists(log_path):
-                logger.error(f"Log file not found at: {log_path}")
-                return False, None
-
             try:
                 with open(log_path, "r", encoding="utf-8") as f:
                     preview = f.read(100)
                     # Remove BOM and other problematic characters for logging
-                    preview_clean = preview.replace('\ufeff', '').replace('\r', '').replace('\n', ' ')
+                    preview_clean = preview.translate(_PREVIEW_CLEANUP)
                     logger.info(f"Successfully opened log file. Preview: {preview_clean[:50]}...")
+            except FileNotFoundError:
+                logger.error(f"Log file not found at: {log_path}")
+                self._invalidate_window_cache()
+                return False, None
             except IOError as e:
                 logger.error(f"Cannot read log file: {e}")
+                self._invalidate_window_cache()
                 return False, None
 
             self.game_found = True
@@ -151,6 +352,7 @@ class GameDetector:
 
         except Exception as e:
             logger.error(f"Error detecting game: {e}")
+            self._invalidate_window_cache()
             return False, None
 
     def get_log_file_path(self) -> Optional[str]:
@@ -165,13 +367,18 @@ class GameDetector:
     def is_game_running(self) -> bool:
         """
         Check if the game is currently running.
+        Reuses the window found by the previous call while it is still valid,
+        and only enumerates windows again when it is gone.
 
         Returns:
             True if game is running, False otherwise.
         """
-        if not WINDOWS_MODULES_AVAILABLE:
+        if not _load_windows_modules():
             return False
 
+        if self._is_cached_window_valid():
+            return True
+
         try:
             hwnd = self._find_game_window()
             return hwnd is not None
@@ -4,14 +4,18 @@ Manages bag state and detects item changes.
 """
 
 import logging
-from typing import Dict, List, Tuple, Optional
+from collections import Counter, defaultdict
+from typing import DefaultDict, Dict, List, Tuple, Optional
 from threading import Lock
 
 from .log_parser import LogParser
-from .constants import MIN_BAG_ITEMS_FOR_INIT, MIN_BAG_ITEMS_LEGACY
+from .constants import BAG_OP_INIT, BAG_OP_MODIFY, MIN_BAG_ITEMS_FOR_INIT, MIN_BAG_ITEMS_LEGACY
 
 logger = logging.getLogger(__name__)
 
+# (page_id, slot_id, config_base_id) identifying one inventory slot's contents
+SlotKey = Tuple[str, str, str]
+
 
 class InventoryTracker:
     """Tracks inventory state and detects item changes."""
@@ -24,7 +28,12 @@ class InventoryTracker:
             log_parser: LogParser instance for parsing log data.
         """
         self.log_parser = log_parser
-        self.bag_state: Dict[str, int] = {}
+        # Slot key -> item count in that slot
+        self.bag_state: Dict[SlotKey, int] = {}
+        # Item ID -> total at the last baseline, for computing net changes
+        self.init_totals: Dict[str, int] = {}
+        # Sum of slot counts per item ID, kept in step with every slot write
+        self._item_totals: Dict[str, int] = {}
         self.bag_initialized = False
         self.initialization_complete = False
         self.awaiting_initialization = False
@@ -36,6 +45,8 @@ class InventoryTracker:
         """Reset all tracking state."""
         with self._lock:
             self.bag_state.clear()
+            self.init_totals.clear()
+            self._item_totals.clear()
             self.bag_initialized = False
             self.initialization_complete = False
             self.awaiting_initialization = False
@@ -43,6 +54,29 @@ class InventoryTracker:
             self.first_scan = True
             logger.info("Inventory tracker reset")
 
+    def _set_slot(self, slot_key: SlotKey, item_id: str, count: int) -> int:
+        """
+        Store the count for an inventory slot and update the item's running total.
+
+        Args:
+            slot_key: Slot key as a (page_id, slot_id, config_base_id) tuple.
+            item_id: Item ID (config_base_id) held in the slot.
+            count: Item count in the slot.
+
+        Returns:
+            Change in the slot's count, counting a new slot up from 0.
+        """
+        prev_count = self.bag_state.get(slot_key)
+        if prev_count == count:
+            return 0
+        if prev_count is None:
+            prev_count = 0
+
+        self.bag_state[slot_key] = count
+        delta = count - prev_count
+        self._item_totals[item_id] = self._item_totals.get(item_id, 0) + delta
+        return delta
+
     def start_initialization(self) -> bool:
         """
         Start the initialization process.
@@ -74,6 +108,10 @@ class InventoryTracker:
             if not self.awaiting_initialization:
                 return False, None
 
+            # Cheap substring probe before running the bag regex over the chunk
+            if BAG_OP_INIT not in text:
+                return False, None
+
             bag_init_entries = self.log_parser.extract_bag_init_data(text)
 
             if len(bag_init_entries) < MIN_BAG_ITEMS_FOR_INIT:
@@ -82,20 +120,14 @@ class InventoryTracker:
             logger.info(f"Found {len(bag_init_entries)} InitBagData entries - initializing")
 
             self.bag_state.clear()
-            item_totals: Dict[str, int] = {}
+            self._item_totals.clear()
 
             for page_id, slot_id, config_base_id, count in bag_init_entries:
-                slot_key = f"{page_id}:{slot_id}:{config_base_id}"
-                self.bag_state[slot_key] = count
-
-                if config_base_id not in item_totals:
-                    item_totals[config_base_id] = 0
-                item_totals[config_base_id] += count
+                self._set_slot((page_id, slot_id, config_base_id), config_base_id, count)
 
             # Store initial totals
-            for item_id, total in item_totals.items():
-                init_key = f"init:{item_id}"
-                self.bag_state[init_key] = total
+            item_totals = self._item_totals
+            self.init_totals = dict(item_totals)
 
             self.bag_initialized = True
             self.initialization_complete = True
@@ -126,16 +158,20 @@ class InventoryTracker:
             if self.log_parser.detect_player_login(text):
                 logger.info("Detected player login - resetting bag state")
                 self.bag_state.clear()
+                self.init_totals.clear()
+                self._item_totals.clear()
                 return True
 
+            if BAG_OP_MODIFY not in text:
+                return False
+
             bag_modifications = self.log_parser.extract_bag_modifications(text)
 
             if len(bag_modifications) > MIN_BAG_ITEMS_LEGACY:
                 logger.info(f"Found {len(bag_modifications)} bag items - initializing (legacy)")
 
                 for page_id, slot_id, config_base_id, count in bag_modifications:
-                    item_key = f"{page_id}:{slot_id}:{config_base_id}"
-                    self.bag_state[item_key] = count
+                    self._set_slot((page_id, slot_id, config_base_id), config_base_id, count)
 
                 self.bag_initialized = True
                 return True
@@ -153,7 +189,7 @@ class InventoryTracker:
             List of (item_id, net_change) tuples.
         """
         with self._lock:
-            if not self.bag_initialized:
+            if not self.bag_initialized or BAG_OP_MODIFY not in text:
                 return []
 
             bag_modifications = self.log_parser.extract_bag_modifications(text)
@@ -162,37 +198,28 @@ class InventoryTracker:
                 return []
 
             changes: List[Tuple[str, int]] = []
-            slot_changes: Dict[str, int] = {}
+            slot_changes: DefaultDict[str, int] = defaultdict(int)
 
             # Track changes per slot
             for page_id, slot_id, config_base_id, count in bag_modifications:
-                slot_key = f"{page_id}:{slot_id}:{config_base_id}"
-                prev_count = self.bag_state.get(slot_key, 0)
-                self.bag_state[slot_key] = count
-
-                if config_base_id not in slot_changes:
-                    slot_changes[config_base_id] = 0
-                slot_changes[config_base_id] += (count - prev_count)
+                slot_changes[config_base_id] += self._set_slot(
+                    (page_id, slot_id, config_base_id), config_base_id, count
+                )
 
             # Calculate net changes
             for item_id, slot_change in slot_changes.items():
                 if slot_change == 0:
                     continue
 
-                init_key = f"init:{item_id}"
-                initial_total = self.bag_state.get(init_key, 0)
+                initial_total = self.init_totals.get(item_id, 0)
 
-                # Calculate current total for this item
-                current_total = sum(
-                    value for key, value in self.bag_state.items()
-                    if not key.startswith("init:") and key.endswith(f":{item_id}")
-                )
+                current_total = self._item_totals.get(item_id, 0)
 
                 net_change = current_total - initial_total
 
                 if net_change != 0:
                     changes.append((item_id, net_change))
-                    self.bag_state[init_key] = current_total
+                    self.init_totals[item_id] = current_total
 
             return changes
 
@@ -234,52 +261,22 @@ class InventoryTracker:
         Returns:
             List of (item_id, change_amount) tuples.
         """
+        if BAG_OP_MODIFY not in text:
+            return []
+
         bag_modifications = self.log_parser.extract_bag_modifications(text)
         if not bag_modifications:
             return []
 
-        drops: List[Tuple[str, int]] = []
-
-        # Calculate previous totals
-        previous_totals: Dict[str, int] = {}
-        for item_key, qty in self.bag_state.items():
-            if ":" not in item_key:
-                continue
-            parts = item_key.split(':')
-            if len(parts) != 3:
-                continue
-            _, _, item_id = parts
-            if item_id not in previous_totals:
-                previous_totals[item_id] = 0
-            previous_totals[item_id] += qty
-
-        # Apply modifications
-        current_state = self.bag_state.copy()
+        # Apply modifications in place, accumulating the net change per item
+        deltas: Counter[str] = Counter()
         for page_id, slot_id, config_base_id, count in bag_modifications:
-            item_key = f"{page_id}:{slot_id}:{config_base_id}"
-            current_state[item_key] = count
-
-        # Calculate current totals
-        current_totals: Dict[str, int] = {}
-        for item_key, qty in current_state.items():
-            if ":" not in item_key:
-                continue
-            parts = item_key.split(':')
-            if len(parts) != 3:
-                continue
-            _, _, item_id = parts
-            if item_id not in current_totals:
-                current_totals[item_id] = 0
-            current_totals[item_id] += qty
-
-        # Find increases (drops)
-        for item_id, current_total in current_totals.items():
-            previous_total = previous_totals.get(item_id, 0)
-            if current_total > previous_total:
-                drops.append((item_id, current_total - previous_total))
-
-        self.bag_state = current_state
-        return drops
+            deltas[config_base_id] += self._set_slot(
+                (page_id, slot_id, config_base_id), config_base_id, count
+            )
+
+        # Find increases (drops); unary plus keeps only positive counts
+        return list((+deltas).items())
 
     def reset_map_baseline(self) -> int:
         """
@@ -289,20 +286,9 @@ class InventoryTracker:
             Number of items in the new baseline.
         """
         with self._lock:
-            item_totals: Dict[str, int] = {}
-
-            for key, value in self.bag_state.items():
-                if not key.startswith("init:") and ":" in key:
-                    parts = key.split(':')
-                    if len(parts) == 3:
-                        item_id = parts[2]
-                        if item_id not in item_totals:
-                            item_totals[item_id] = 0
-                        item_totals[item_id] += value
-
-            for item_id, total in item_totals.items():
-                init_key = f"init:{item_id}"
-                self.bag_state[init_key] = total
+            # The running per-item totals already are the current inventory
+            item_totals = self._item_totals
+            self.init_totals.update(item_totals)
 
             logger.info(f"Reset map baseline for {len(item_totals)} items")
             return len(item_totals)
@@ -315,18 +301,9 @@ class InventoryTracker:
             Dictionary mapping item IDs to total quantities.
         """
         with self._lock:
-            grouped: Dict[str, int] = {}
-
-            for key, amount in self.bag_state.items():
-                if key.startswith("init:"):
-                    item_id = key.split(':')[1]
-                elif ":" in key and len(key.split(':')) == 3:
-                    _, _, item_id = key.split(':')
-                else:
-                    item_id = key
-
-                if item_id not in grouped:
-                    grouped[item_id] = 0
-                grouped[item_id] += amount
+            grouped: DefaultDict[str, int] = defaultdict(int, self.init_totals)
+
+            for item_id, total in self._item_totals.items():
+                grouped[item_id] += total
 
             return grouped
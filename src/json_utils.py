@@ -0,0 +1,96 @@
+"""
+JSON helpers for the Torchlight Infinite Price Tracker.
+Wraps the optional orjson backend so every module reads and writes JSON the same way.
+"""
+
+import json
+import os
+from typing import Any, Union
+
+# Import optional fast JSON backend with a stdlib fallback
+ORJSON_AVAILABLE = False
+orjson: Any = None
+
+try:
+    import orjson  # type: ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+
+def json_loads(raw: Union[bytes, memoryview]) -> Any:
+    """
+    Parse JSON from raw file bytes with orjson when available.
+
+    Args:
+        raw: UTF-8 encoded JSON document.
+
+    Returns:
+        Parsed data.
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid (orjson's error subclasses it).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw) if isinstance(raw, memoryview) else raw)
+
+
+def json_dumps(data: Any, pretty: bool = True) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes with orjson when available.
+
+    Both backends produce the same layout: two-space indentation when pretty
+    (the only indent orjson supports), no whitespace otherwise.
+
+    Args:
+        data: Data to serialize.
+        pretty: Indent the output for files people read or edit. Machine-only
+            files are written compact, which roughly halves their size.
+
+    Returns:
+        Encoded JSON document.
+
+    Raises:
+        TypeError: If the data is not serializable (orjson's error subclasses it).
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def atomic_write_bytes(path: str, payload: bytes, durable: bool = True) -> None:
+    """
+    Replace a file's contents atomically.
+
+    The payload is written to a sibling temp file which is then renamed over
+    the target, so a crash mid-write never leaves a truncated file.
+
+    Args:
+        path: Destination file path.
+        payload: Complete new file contents.
+        durable: fsync the temp file before the rename, so the new contents
+            also survive a power loss. Files that can be rebuilt skip it.
+
+    Raises:
+        OSError: If the file cannot be written or replaced.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
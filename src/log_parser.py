@@ -4,30 +4,53 @@ Handles extraction of game events from log files.
 """
 
 import logging
-import re
 import time
-from typing import Dict, List, Optional, Tuple
+from itertools import islice
+from statistics import fmean
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from .constants import (
+    BAG_EVENT_MARKER,
+    BAG_OP_INIT,
     EXCLUDED_ITEM_ID,
-    PATTERN_BAG_INIT,
-    PATTERN_BAG_MODIFY,
-    PATTERN_MAP_ENTER,
-    PATTERN_MAP_EXIT,
-    PATTERN_PRICE_ID,
+    MAP_HIDEOUT_SCENE,
+    PRICE_RECV_HEADER,
+    PRICE_RECV_MARKER,
     PRICE_SAMPLE_SIZE,
+    PRICE_SEARCH_MARKER,
+    RE_BAG,
+    RE_MAP_ENTER,
+    RE_MAP_EXIT,
+    RE_PRICE_ID,
+    RE_PRICE_VALUE,
 )
 from .file_manager import FileManager
 
 logger = logging.getLogger(__name__)
 
-# Pre-compile regex patterns for performance
-_REGEX_PRICE_ID = re.compile(PATTERN_PRICE_ID, re.DOTALL)
-_REGEX_BAG_MODIFY = re.compile(PATTERN_BAG_MODIFY)
-_REGEX_BAG_INIT = re.compile(PATTERN_BAG_INIT)
-_REGEX_MAP_ENTER = re.compile(PATTERN_MAP_ENTER)
-_REGEX_MAP_EXIT = re.compile(PATTERN_MAP_EXIT)
-_REGEX_VALUE_PATTERN = re.compile(r'\+\d+\s+\[([\d.]+)\]')
+
+def _iter_lines_containing(text: str, needle: str) -> Iterator[str]:
+    """
+    Yield only the lines of text that contain the given substring.
+
+    Avoids splitting the whole chunk: lines are located around each
+    occurrence of the needle with str.find/rfind.
+
+    Args:
+        text: Log text to search.
+        needle: Literal substring the lines must contain.
+
+    Yields:
+        Each matching line (without its trailing newline).
+    """
+    pos = text.find(needle)
+    while pos != -1:
+        line_start = text.rfind('\n', 0, pos) + 1
+        line_end = text.find('\n', pos)
+        if line_end == -1:
+            line_end = len(text)
+        yield text[line_start:line_end]
+        pos = text.find(needle, line_end)
 
 
 class LogParser:
@@ -42,6 +65,10 @@ class LogParser:
         """
         self.file_manager = file_manager
 
+        # Result of the last bag scan, keyed by the identity of the text chunk
+        self._bag_scan_text: Optional[str] = None
+        self._bag_scan_result: Tuple[List[Tuple[str, str, str, int]], List[Tuple[str, str, str, int]]] = ([], [])
+
     def extract_price_info(self, text: str) -> List[Tuple[str, float]]:
         """
         Extract price information from game logs.
@@ -53,14 +80,28 @@ class LogParser:
             List of (item_id, price) tuples.
         """
         price_updates = []
+        # Most chunks carry no price search at all; skip the DOTALL regex for them
+        if PRICE_SEARCH_MARKER not in text:
+            return price_updates
+
         try:
-            matches = _REGEX_PRICE_ID.findall(text)
+            matches = RE_PRICE_ID.findall(text)
+            if not matches:
+                return price_updates
+
+            # Index every response block once instead of searching the text per SynId
+            blocks = self._index_price_blocks(text)
 
             for synid, item_id in matches:
                 if item_id == EXCLUDED_ITEM_ID:
                     continue
 
-                price = self._extract_price_for_item(text, synid, item_id)
+                span = blocks.get(synid)
+                if span is None:
+                    logger.debug(f'No price data found for ID: {item_id}')
+                    continue
+
+                price = self._extract_price_for_item(text, span, item_id)
                 if price is not None:
                     price_updates.append((item_id, price))
 
@@ -69,43 +110,74 @@ class LogParser:
 
         return price_updates
 
-    def _extract_price_for_item(self, text: str, synid: str, item_id: str) -> Optional[float]:
+    @staticmethod
+    def _index_price_blocks(text: str) -> Dict[str, Tuple[int, int]]:
         """
-        Extract price for a specific item from log text.
+        Map each SynId to the span of its price search response data block.
+
+        Walks the response headers once with plain string search; each block
+        runs up to the next response marker. Only offsets are kept, so no
+        block is copied out of the chunk. If a SynId is answered more than
+        once, the first response wins.
 
         Args:
             text: Log text to parse.
-            synid: Synchronization ID.
-            item_id: Item ID.
 
         Returns:
-            Average price or None if not found.
+            Dictionary of {synid: (block_start, block_end)}.
         """
-        try:
-            pattern = re.compile(
-                rf'----Socket RecvMessage STT----XchgSearchPrice----SynId = {synid}\s+'
-                r'\[.*?\]\s*GameLog: Display: \[Game\]\s+'
-                r'(.*?)(?=----Socket RecvMessage STT----|$)',
-                re.DOTALL
-            )
+        blocks: Dict[str, Tuple[int, int]] = {}
+        text_len = len(text)
+        header_len = len(PRICE_RECV_HEADER)
+
+        start = text.find(PRICE_RECV_HEADER)
+        while start != -1:
+            synid_start = start + header_len
+            synid_end = synid_start
+            while synid_end < text_len and not text[synid_end].isspace():
+                synid_end += 1
+            if synid_end == text_len:
+                # Header cut off at the end of the chunk
+                break
+
+            block_end = text.find(PRICE_RECV_MARKER, synid_end)
+            if block_end == -1:
+                block_end = text_len
+
+            synid = text[synid_start:synid_end]
+            if synid not in blocks:
+                blocks[synid] = (synid_end, block_end)
 
-            match = pattern.search(text)
-            if not match:
-                logger.debug(f'No price data found for ID: {item_id}')
-                return None
+            start = text.find(PRICE_RECV_HEADER, synid_end)
 
-            data_block = match.group(1)
+        return blocks
+
+    def _extract_price_for_item(self, text: str, span: Tuple[int, int], item_id: str) -> Optional[float]:
+        """
+        Extract price for a specific item from its response data block.
+
+        Args:
+            text: Log text to parse.
+            span: (start, end) offsets of the response data block in text.
+            item_id: Item ID.
 
-            # Extract all +number [value] patterns using pre-compiled regex
-            values = _REGEX_VALUE_PATTERN.findall(data_block)
+        Returns:
+            Average price or None if not found.
+        """
+        try:
+            # Match within the block in place, and stop once the first N
+            # +number [value] entries have been found since only those are averaged
+            block_start, block_end = span
+            values = [
+                float(match.group(1))
+                for match in islice(RE_PRICE_VALUE.finditer(text, block_start, block_end), PRICE_SAMPLE_SIZE)
+            ]
 
             if not values:
                 return -1.0
 
             # Calculate average of first N values
-            num_values = min(len(values), PRICE_SAMPLE_SIZE)
-            sum_values = sum(float(values[i]) for i in range(num_values))
-            average_value = sum_values / num_values
+            average_value = fmean(values)
 
             return round(average_value, 4)
 
@@ -131,23 +203,27 @@ class LogParser:
         update_count = 0
         current_time = round(time.time())
 
-        # If API is enabled, update items individually for efficiency
+        # If API is enabled, send the batch to the API together and write the
+        # local table once
         if self.file_manager.api_client:
             full_table = self.file_manager.load_full_table()
 
+            batch: Dict[str, Dict[str, Any]] = {}
             for item_id, price in price_updates:
-                if item_id in full_table:
-                    updates = {
+                # The first price seen for an item in this chunk wins
+                if item_id in full_table and item_id not in batch:
+                    batch[item_id] = {
                         'last_time': current_time,
                         'from': "Local",
                         'price': price,
                         'last_update': current_time
                     }
 
-                    if self.file_manager.update_item(item_id, updates):
-                        item_name = full_table[item_id].get("name", item_id)
-                        logger.info(f'Updated price: {item_name} (ID:{item_id}) = {price}')
-                        update_count += 1
+            if batch:
+                for item_id in self.file_manager.update_items(batch, now=current_time):
+                    item_name = full_table[item_id].get("name", item_id)
+                    logger.info(f'Updated price: {item_name} (ID:{item_id}) = {batch[item_id]["price"]}')
+                    update_count += 1
         else:
             # Use batch update for local file
             full_table = self.file_manager.load_full_table()
@@ -168,6 +244,37 @@ class LogParser:
 
         return update_count
 
+    def _scan_bag_events(self, text: str) -> Tuple[List[Tuple[str, str, str, int]], List[Tuple[str, str, str, int]]]:
+        """
+        Extract both kinds of bag event from log text in a single regex pass.
+
+        The result is remembered for the most recent chunk, so the
+        modification and initialization extractors share one scan.
+
+        Args:
+            text: Log text to parse.
+
+        Returns:
+            Tuple of (modifications, init_entries), each a list of
+            (page_id, slot_id, config_base_id, count) tuples.
+        """
+        if text is self._bag_scan_text:
+            return self._bag_scan_result
+
+        self._bag_scan_text = text
+        if BAG_EVENT_MARKER not in text:
+            self._bag_scan_result = ([], [])
+            return self._bag_scan_result
+
+        modifications: List[Tuple[str, str, str, int]] = []
+        init_entries: List[Tuple[str, str, str, int]] = []
+        for op, page_id, slot_id, config_base_id, count in RE_BAG.findall(text):
+            entries = init_entries if op == BAG_OP_INIT else modifications
+            entries.append((page_id, slot_id, config_base_id, int(count)))
+
+        self._bag_scan_result = (modifications, init_entries)
+        return self._bag_scan_result
+
     def extract_bag_modifications(self, text: str) -> List[Tuple[str, str, str, int]]:
         """
         Extract bag modification events from log text.
@@ -178,9 +285,7 @@ class LogParser:
         Returns:
             List of (page_id, slot_id, config_base_id, count) tuples.
         """
-        matches = _REGEX_BAG_MODIFY.findall(text)
-        return [(page_id, slot_id, config_base_id, int(count))
-                for page_id, slot_id, config_base_id, count in matches]
+        return self._scan_bag_events(text)[0]
 
     def extract_bag_init_data(self, text: str) -> List[Tuple[str, str, str, int]]:
         """
@@ -192,9 +297,7 @@ class LogParser:
         Returns:
             List of (page_id, slot_id, config_base_id, count) tuples.
         """
-        matches = _REGEX_BAG_INIT.findall(text)
-        return [(page_id, slot_id, config_base_id, int(count))
-                for page_id, slot_id, config_base_id, count in matches]
+        return self._scan_bag_events(text)[1]
 
     def detect_map_change(self, text: str) -> Tuple[bool, bool]:
         """
@@ -206,8 +309,19 @@ class LogParser:
         Returns:
             Tuple of (entering_map, exiting_map) booleans.
         """
-        entering_map = bool(_REGEX_MAP_ENTER.search(text))
-        exiting_map = bool(_REGEX_MAP_EXIT.search(text))
+        entering_map = False
+        exiting_map = False
+
+        # Both patterns sit on a single scene-transition line naming the hideout,
+        # so the regexes only need to run on those short lines
+        for line in _iter_lines_containing(text, MAP_HIDEOUT_SCENE):
+            if not entering_map and RE_MAP_ENTER.search(line):
+                entering_map = True
+            if not exiting_map and RE_MAP_EXIT.search(line):
+                exiting_map = True
+            if entering_map and exiting_map:
+                break
+
         return entering_map, exiting_map
 
     def detect_player_login(self, text: str) -> bool:
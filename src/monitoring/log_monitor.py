@@ -3,7 +3,10 @@ Log monitoring thread for the Torchlight Infinite Price Tracker.
 Monitors the game log file and processes events.
 """
 
+import codecs
+import io
 import logging
+import os
 import time
 import threading
 from typing import Optional
@@ -57,6 +60,8 @@ class LogMonitorThread(threading.Thread):
         self.app_running_callback = app_running_callback
         self.log_file = None
         self.last_reopen_check = time.time()
+        self._position = 0
+        self._decoder: Optional[io.IncrementalNewlineDecoder] = None
 
     def _open_log_file(self) -> bool:
         """
@@ -69,8 +74,14 @@ class LogMonitorThread(threading.Thread):
             return False
 
         try:
-            self.log_file = open(self.log_file_path, "r", encoding="utf-8")
-            self.log_file.seek(0, 2)  # Seek to end
+            self.log_file = open(self.log_file_path, "rb")
+            self._position = self.log_file.seek(0, 2)  # Seek to end
+            # Decode incrementally so a UTF-8 sequence split across two reads
+            # survives, and normalize newlines as text mode would
+            self._decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder("utf-8")(errors="replace"),
+                translate=True
+            )
             logger.info("Log file opened successfully")
             return True
         except (IOError, OSError) as e:
@@ -99,12 +110,36 @@ class LogMonitorThread(threading.Thread):
 
         # Check if file still exists and is accessible
         if self.log_file_path:
-            import os
             if not os.path.exists(self.log_file_path):
                 logger.warning("Log file no longer exists, attempting to reopen")
                 self._close_log_file()
                 self._open_log_file()
 
+    def _read_new_text(self) -> str:
+        """
+        Read whatever has been appended to the log file since the last call.
+
+        The file size is checked with fstat first so idle ticks cost a single
+        syscall, and exactly the appended bytes are read when there is data.
+        If the file shrank (the game truncated it on restart), reading resumes
+        from the beginning.
+
+        Returns:
+            Newly appended text, or an empty string if nothing changed.
+        """
+        size = os.fstat(self.log_file.fileno()).st_size
+        if size < self._position:
+            logger.info("Log file was truncated, reading from the beginning")
+            self.log_file.seek(0)
+            self._position = 0
+            self._decoder.reset()
+        if size == self._position:
+            return ""
+
+        data = self.log_file.read(size - self._position)
+        self._position += len(data)
+        return self._decoder.decode(data)
+
     def run(self) -> None:
         """Run the log monitoring loop."""
         if not self.log_file_path:
@@ -132,7 +167,7 @@ class LogMonitorThread(threading.Thread):
                     # Read and process log file
                     if self.log_file:
                         try:
-                            text = self.log_file.read()
+                            text = self._read_new_text()
                             if text:
                                 self._process_log_text(text)
                         except (IOError, OSError) as e:
@@ -141,6 +176,9 @@ class LogMonitorThread(threading.Thread):
                             self._close_log_file()
                             self._open_log_file()
 
+                    # Write out drop log lines buffered for long enough
+                    self.statistics_tracker.flush_drop_log()
+
                     # Update display via signal
                     self.signals.update_display.emit()
 
@@ -5,8 +5,9 @@ Manages drop statistics, income calculations, and map tracking.
 
 import logging
 import time
+from collections import defaultdict
 from threading import Lock
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, DefaultDict, Dict, List, Optional, Set, Tuple
 
 from .config_manager import ConfigManager
 from .constants import calculate_price_with_tax
@@ -34,13 +35,13 @@ class StatisticsTracker:
         self.total_time = 0.0
         self.map_count = 0
 
-        self.drop_list: Dict[str, int] = {}
-        self.drop_list_all: Dict[str, int] = {}
+        self.drop_list: DefaultDict[str, int] = defaultdict(int)
+        self.drop_list_all: DefaultDict[str, int] = defaultdict(int)
         self.income = 0.0
         self.income_all = 0.0
 
         self.exclude_list: Set[str] = set()
-        self.pending_items: Dict[str, int] = {}
+        self.pending_items: DefaultDict[str, int] = defaultdict(int)
 
         self._lock = Lock()
 
@@ -88,19 +89,17 @@ class StatisticsTracker:
         """
         with self._lock:
             full_table = self.file_manager.load_full_table()
+            tax_enabled = self.config_manager.is_tax_enabled()
             processed = []
 
             # Consolidate changes for the same item
-            consolidated: Dict[str, int] = {}
+            consolidated: DefaultDict[str, int] = defaultdict(int)
             for item_id, amount in changes:
-                item_id = str(item_id)
-                if item_id not in consolidated:
-                    consolidated[item_id] = 0
-                consolidated[item_id] += amount
+                consolidated[str(item_id)] += amount
 
             # Process each consolidated change
             for item_id, amount in consolidated.items():
-                result = self._process_single_item_change(item_id, amount, full_table)
+                result = self._process_single_item_change(item_id, amount, full_table, tax_enabled)
                 if result:
                     processed.append(result)
 
@@ -110,7 +109,8 @@ class StatisticsTracker:
         self,
         item_id: str,
         amount: int,
-        full_table: Dict[str, Any]
+        full_table: Dict[str, Any],
+        tax_enabled: bool
     ) -> Optional[Tuple[str, str, int, float]]:
         """
         Process a single item change.
@@ -119,46 +119,36 @@ class StatisticsTracker:
             item_id: Item ID.
             amount: Amount changed.
             full_table: Full item table.
+            tax_enabled: Whether tax is applied, resolved once per batch by the caller.
 
         Returns:
             Tuple of (item_id, item_name, amount, price) or None if excluded/unknown.
         """
         # Get item name
-        if item_id in full_table:
-            item_name = full_table[item_id].get("name", f"Unknown item (ID: {item_id})")
-        else:
-            item_name = f"Unknown item (ID: {item_id})"
+        entry = full_table.get(item_id)
+        if entry is None:
             if item_id not in self.pending_items:
                 logger.warning(f"Unknown item ID: {item_id}")
-                self.pending_items[item_id] = amount
-            else:
-                self.pending_items[item_id] += amount
+            self.pending_items[item_id] += amount
             return None
 
+        item_name = self.file_manager.get_item_name(item_id, full_table)
+
         # Check if excluded
         if self.exclude_list and item_name in self.exclude_list:
             logger.debug(f"Excluded: {item_name} x{amount}")
             return None
 
         # Update drop lists
-        if item_id not in self.drop_list:
-            self.drop_list[item_id] = 0
         self.drop_list[item_id] += amount
-
-        if item_id not in self.drop_list_all:
-            self.drop_list_all[item_id] = 0
         self.drop_list_all[item_id] += amount
 
-        # Calculate price
-        price = 0.0
-        if item_id in full_table:
-            base_price = full_table[item_id].get("price", 0.0)
-            # Apply tax if enabled using centralized calculation
-            price = calculate_price_with_tax(base_price, item_id, self.config_manager.is_tax_enabled())
+        # Calculate price, applying tax if enabled using centralized calculation
+        price = calculate_price_with_tax(entry.get("price", 0.0), item_id, tax_enabled)
 
-            # Update income
-            self.income += price * amount
-            self.income_all += price * amount
+        # Update income
+        self.income += price * amount
+        self.income_all += price * amount
 
         # Log to file
         self._log_item_change(item_name, amount, price)
@@ -187,6 +177,24 @@ class StatisticsTracker:
 
         self.file_manager.append_to_drop_log(message)
 
+    def flush_drop_log(self) -> None:
+        """Write out drop log lines that have been buffered for long enough."""
+        self.file_manager.flush_drop_log()
+
+    def get_drop_counts(self, include_all_maps: bool) -> Dict[str, int]:
+        """
+        Get a snapshot of drop counts without computing time or income figures.
+
+        Args:
+            include_all_maps: True for drops across all maps, False for the current map.
+
+        Returns:
+            Dictionary of {item_id: count}.
+        """
+        with self._lock:
+            source = self.drop_list_all if include_all_maps else self.drop_list
+            return dict(source)
+
     def get_current_map_stats(self) -> Dict[str, Any]:
         """
         Get statistics for the current map.
@@ -227,6 +235,32 @@ class StatisticsTracker:
                 "income_per_minute": (self.income_all / (total_time / 60)) if total_time > 0 else 0
             }
 
+    def get_display_stats(self) -> Dict[str, Any]:
+        """
+        Get the time and income figures shown in the stats card.
+
+        Takes the lock once and reads the clock once for both the current map
+        and the totals, without copying the drop lists.
+
+        Returns:
+            Dictionary with in_map flag, current map figures and total figures.
+        """
+        with self._lock:
+            now = time.time()
+            duration = now - self.map_start_time if self.is_in_map else 0
+            total_time = self.total_time + duration
+
+            return {
+                "is_in_map": self.is_in_map,
+                "income": self.income,
+                "duration": duration,
+                "income_per_minute": (self.income / (duration / 60)) if duration > 0 else 0,
+                "total_income": self.income_all,
+                "total_duration": total_time,
+                "total_income_per_minute": (self.income_all / (total_time / 60)) if total_time > 0 else 0,
+                "map_count": self.map_count
+            }
+
     def get_formatted_time(self, seconds: float) -> str:
         """
         Format seconds as "Xm Ys" string.
@@ -2,7 +2,7 @@
 Dialog windows for the Torchlight Infinite Price Tracker.
 """
 
-from typing import Callable, List
+from typing import Callable, FrozenSet, Iterable, Sequence
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QComboBox
@@ -18,26 +18,26 @@ class DropsDetailDialog(QDialog):
     def __init__(
         self,
         parent,
-        item_types: List[str],
-        filter_currency: List[str],
-        filter_ashes: List[str],
-        filter_compass: List[str],
-        filter_glow: List[str],
-        filter_others: List[str],
+        item_types: Sequence[str],
+        filter_currency: FrozenSet[str],
+        filter_ashes: FrozenSet[str],
+        filter_compass: FrozenSet[str],
+        filter_glow: FrozenSet[str],
+        filter_others: FrozenSet[str],
         on_change_view: Callable[[], None],
-        on_filter_change: Callable[[List[str]], None]
+        on_filter_change: Callable[[Iterable[str]], None]
     ):
         """
         Initialize the drops detail dialog.
 
         Args:
             parent: Parent widget
-            item_types: List of all item types
-            filter_currency: Currency filter list
-            filter_ashes: Embers filter list
-            filter_compass: Compass filter list
-            filter_glow: Memory filter list
-            filter_others: Others filter list
+            item_types: All item types, in display order
+            filter_currency: Currency filter set
+            filter_ashes: Embers filter set
+            filter_compass: Compass filter set
+            filter_glow: Memory filter set
+            filter_others: Others filter set
             on_change_view: Callback for changing view
             on_filter_change: Callback for filter changes
         """
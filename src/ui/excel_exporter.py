@@ -16,7 +16,7 @@ from ..constants import (
     EXCEL_COLUMN_PADDING,
     EXCEL_HEADER_COLOR,
     EXCEL_MAX_COLUMN_WIDTH,
-    ITEM_TYPES,
+    ITEM_TYPE_ORDER,
     calculate_fe_per_hour,
     calculate_price_with_tax,
     format_duration,
@@ -88,7 +88,7 @@ class ExcelExporter:
         # Sort by category, then by total value descending
         drop_data.sort(
             key=lambda x: (
-                ITEM_TYPES.index(x['category']) if x['category'] in ITEM_TYPES else 999,
+                ITEM_TYPE_ORDER.get(x['category'], 999),
                 -x['total_value']
             )
         )
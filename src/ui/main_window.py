@@ -4,7 +4,7 @@ Main window for the Torchlight Infinite Price Tracker.
 
 import logging
 import time
-from typing import Optional
+from typing import Iterable, List, Optional
 from datetime import datetime
 
 from PyQt5.QtWidgets import (
@@ -22,12 +22,15 @@ from ..constants import (
     FILTER_GLOW,
     FILTER_OTHERS,
     ITEM_TYPES,
+    ITEM_TYPES_SET,
     UI_COLORS,
     UI_DEFAULT_WINDOW_HEIGHT,
     UI_DEFAULT_WINDOW_WIDTH,
+    UI_GEOMETRY_SAVE_DELAY_MS,
     UI_LISTBOX_HEIGHT,
     UI_MIN_WINDOW_HEIGHT,
     UI_MIN_WINDOW_WIDTH,
+    UI_RESHOW_DELAY_MS,
     calculate_price_with_tax,
     get_price_freshness_indicator,
 )
@@ -75,7 +78,8 @@ class TrackerMainWindow(QMainWindow):
 
         self.app_running = True
         self.show_all = False
-        self.current_show_types = ITEM_TYPES.copy()
+        self.current_show_types = ITEM_TYPES_SET
+        self._last_drop_rows: Optional[List[str]] = None
 
         # Initialize color palette
         self.colors = UI_COLORS
@@ -85,6 +89,7 @@ class TrackerMainWindow(QMainWindow):
         self._create_widgets()
         self._create_dialogs()
         self._create_tray_icon()
+        self._create_timers()
         self._load_window_geometry()
 
     def _setup_window(self) -> None:
@@ -187,6 +192,22 @@ class TrackerMainWindow(QMainWindow):
 
         logger.info("System tray icon created")
 
+    def _create_timers(self) -> None:
+        """Create timers used to coalesce UI refreshes."""
+        # Drop notifications from the log monitor can arrive in bursts;
+        # a single-shot timer drains them into one reshow() on the UI thread
+        self._reshow_timer = QTimer(self)
+        self._reshow_timer.setSingleShot(True)
+        self._reshow_timer.setInterval(UI_RESHOW_DELAY_MS)
+        self._reshow_timer.timeout.connect(self.reshow)
+
+        # Move/resize events fire for every pixel of a drag; write the
+        # geometry to config once the window has settled
+        self._geometry_save_timer = QTimer(self)
+        self._geometry_save_timer.setSingleShot(True)
+        self._geometry_save_timer.setInterval(UI_GEOMETRY_SAVE_DELAY_MS)
+        self._geometry_save_timer.timeout.connect(self._save_window_geometry)
+
     def _load_window_geometry(self) -> None:
         """Load saved window geometry from config."""
         config = self.config_manager.get()
@@ -197,6 +218,12 @@ class TrackerMainWindow(QMainWindow):
                 logger.info(f"Loaded window geometry: {config.window_x},{config.window_y} "
                            f"{config.window_width}x{config.window_height}")
 
+    def _flush_window_geometry(self) -> None:
+        """Save window geometry now if a debounced save is pending."""
+        if self._geometry_save_timer.isActive():
+            self._geometry_save_timer.stop()
+            self._save_window_geometry()
+
     def _save_window_geometry(self) -> None:
         """Save window geometry to config."""
         if not self.isMaximized() and not self.isMinimized():
@@ -248,6 +275,9 @@ class TrackerMainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             # Signal the app to stop
             self.app_running = False
+            self._flush_window_geometry()
+            self.config_manager.flush()
+            self.file_manager.close_drop_log()
 
             # Hide tray icon
             if hasattr(self, 'tray_icon') and self.tray_icon:
@@ -288,6 +318,7 @@ class TrackerMainWindow(QMainWindow):
             # Update UI
             self.stats_card.reset_stats()
             self.drops_card.inner_panel_drop_listbox.clear()
+            self._last_drop_rows = []
 
             QMessageBox.information(
                 self,
@@ -315,14 +346,15 @@ class TrackerMainWindow(QMainWindow):
 
         self.reshow()
 
-    def set_filter(self, item_types: list) -> None:
+    def set_filter(self, item_types: Iterable[str]) -> None:
         """
         Set the item type filter.
 
         Args:
-            item_types: List of item types to display
+            item_types: Item types to display
         """
-        self.current_show_types = item_types
+        # Frozen so the per-row membership test in reshow() is a hash lookup
+        self.current_show_types = frozenset(item_types)
         self.drops_card.set_filter_active(item_types)
         self.reshow()
 
@@ -367,37 +399,33 @@ class TrackerMainWindow(QMainWindow):
         """Refresh the drop display."""
         full_table = self.file_manager.load_full_table()
 
-        # Get appropriate drop list
-        if self.show_all:
-            stats = self.statistics_tracker.get_total_stats()
-        else:
-            stats = self.statistics_tracker.get_current_map_stats()
+        # Only the listbox is rebuilt here; the time/income labels are
+        # refreshed separately by update_display()
+        drops = self.statistics_tracker.get_drop_counts(self.show_all)
 
-        # Update labels
-        current_map_stats = self.statistics_tracker.get_current_map_stats()
-        total_stats = self.statistics_tracker.get_total_stats()
+        # Resolve per-refresh values once rather than for every row
+        now = time.time()
+        tax_enabled = self.config_manager.is_tax_enabled()
+        show_types = self.current_show_types
 
         # Prepare drop items with their values for sorting
         drop_items = []
-        for item_id, count in stats['drops'].items():
-            if item_id not in full_table:
+        for item_id, count in drops.items():
+            item_data = full_table.get(item_id)
+            if item_data is None:
                 continue
 
-            item_data = full_table[item_id]
-            item_name = item_data.get("name", item_id)
             item_type = item_data.get("type", "Unknown")
-
-            if item_type not in self.current_show_types:
+            if item_type not in show_types:
                 continue
 
+            item_name = item_data.get("name", item_id)
+
             # Determine status based on last update time using helper
-            now = time.time()
-            last_update = item_data.get("last_update", 0)
-            status = get_price_freshness_indicator(last_update, now)
+            status = get_price_freshness_indicator(item_data.get("last_update", 0), now)
 
             # Calculate price with tax if applicable using centralized function
-            base_price = item_data.get("price", 0)
-            item_price = calculate_price_with_tax(base_price, item_id, self.config_manager.is_tax_enabled())
+            item_price = calculate_price_with_tax(item_data.get("price", 0), item_id, tax_enabled)
 
             total_value = round(count * item_price, 2)
             drop_items.append((total_value, f"{status} {item_name} x{count} [{total_value}]"))
@@ -405,27 +433,37 @@ class TrackerMainWindow(QMainWindow):
         # Sort by total value (descending - highest first)
         drop_items.sort(key=lambda x: x[0], reverse=True)
 
-        # Update drop listbox
-        self.drops_card.inner_panel_drop_listbox.clear()
-        for _, item_text in drop_items:
-            self.drops_card.inner_panel_drop_listbox.addItem(item_text)
+        # Leave the listbox alone if the rendered rows are unchanged
+        rows = [item_text for _, item_text in drop_items]
+        if rows == self._last_drop_rows:
+            return
+        self._last_drop_rows = rows
+
+        # Update drop listbox in a single batch insert
+        listbox = self.drops_card.inner_panel_drop_listbox
+        listbox.clear()
+        listbox.addItems(rows)
+
+    def schedule_reshow(self) -> None:
+        """Request a drop display refresh, coalescing bursts into one reshow()."""
+        if not self._reshow_timer.isActive():
+            self._reshow_timer.start()
 
     def update_display(self) -> None:
         """Update the time and income displays."""
-        if self.statistics_tracker.is_in_map:
-            current_stats = self.statistics_tracker.get_current_map_stats()
+        stats = self.statistics_tracker.get_display_stats()
+        if stats['is_in_map']:
             self.stats_card.update_current_map_stats(
-                current_stats['duration'],
-                current_stats['income'],
-                current_stats['income_per_minute']
+                stats['duration'],
+                stats['income'],
+                stats['income_per_minute']
             )
 
-        total_stats = self.statistics_tracker.get_total_stats()
         self.stats_card.update_total_stats(
-            total_stats['duration'],
-            total_stats['income'],
-            total_stats['income_per_minute'],
-            total_stats['map_count']
+            stats['total_duration'],
+            stats['total_income'],
+            stats['total_income_per_minute'],
+            stats['map_count']
         )
 
     def show_from_tray(self) -> None:
@@ -442,6 +480,9 @@ class TrackerMainWindow(QMainWindow):
     def quit_application(self) -> None:
         """Quit the application."""
         self.app_running = False
+        self._flush_window_geometry()
+        self.config_manager.flush()
+        self.file_manager.close_drop_log()
         QApplication.quit()
 
     def changeEvent(self, event) -> None:
@@ -461,12 +502,12 @@ class TrackerMainWindow(QMainWindow):
     def moveEvent(self, event) -> None:
         """Handle window move event."""
         super().moveEvent(event)
-        self._save_window_geometry()
+        self._geometry_save_timer.start()
 
     def resizeEvent(self, event) -> None:
         """Handle window resize event."""
         super().resizeEvent(event)
-        self._save_window_geometry()
+        self._geometry_save_timer.start()
 
     def export_drops_to_excel(self) -> None:
         """Export drops to an Excel file sorted by item category."""
@@ -2,7 +2,7 @@
 Drops display card widget for the Torchlight Infinite Price Tracker.
 """
 
-from typing import Callable, Dict, List
+from typing import Callable, Dict, FrozenSet, Iterable, Sequence
 from PyQt5.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QListWidget
 from PyQt5.QtCore import Qt
 
@@ -12,26 +12,26 @@ class DropsCard(QFrame):
 
     def __init__(
         self,
-        item_types: List[str],
-        filter_currency: List[str],
-        filter_ashes: List[str],
-        filter_compass: List[str],
-        filter_glow: List[str],
-        filter_others: List[str],
+        item_types: Sequence[str],
+        filter_currency: FrozenSet[str],
+        filter_ashes: FrozenSet[str],
+        filter_compass: FrozenSet[str],
+        filter_glow: FrozenSet[str],
+        filter_others: FrozenSet[str],
         listbox_height: int,
         on_change_view: Callable[[], None],
-        on_filter_change: Callable[[List[str]], None]
+        on_filter_change: Callable[[Iterable[str]], None]
     ):
         """
         Initialize the drops card.
 
         Args:
-            item_types: List of all item types
-            filter_currency: Currency filter list
-            filter_ashes: Embers filter list
-            filter_compass: Compass filter list
-            filter_glow: Memory filter list
-            filter_others: Others filter list
+            item_types: All item types, in display order
+            filter_currency: Currency filter set
+            filter_ashes: Embers filter set
+            filter_compass: Compass filter set
+            filter_glow: Memory filter set
+            filter_others: Others filter set
             listbox_height: Height multiplier for listbox
             on_change_view: Callback for changing view (current map / all drops)
             on_filter_change: Callback for filter changes
@@ -128,12 +128,12 @@ class DropsCard(QFrame):
 
         # Store filter buttons for easy access
         self.filter_buttons = {
-            tuple(self.item_types): self.btn_filter_all,
-            tuple(self.filter_currency): self.btn_filter_currency,
-            tuple(self.filter_ashes): self.btn_filter_embers,
-            tuple(self.filter_compass): self.btn_filter_compass,
-            tuple(self.filter_glow): self.btn_filter_memory,
-            tuple(self.filter_others): self.btn_filter_others,
+            frozenset(self.item_types): self.btn_filter_all,
+            frozenset(self.filter_currency): self.btn_filter_currency,
+            frozenset(self.filter_ashes): self.btn_filter_embers,
+            frozenset(self.filter_compass): self.btn_filter_compass,
+            frozenset(self.filter_glow): self.btn_filter_memory,
+            frozenset(self.filter_others): self.btn_filter_others,
         }
 
         # Drops list
@@ -142,14 +142,14 @@ class DropsCard(QFrame):
         self.inner_panel_drop_listbox.addItem("Drops will be displayed here...")
         layout.addWidget(self.inner_panel_drop_listbox)
 
-    def set_filter_active(self, item_types: List[str]) -> None:
+    def set_filter_active(self, item_types: Iterable[str]) -> None:
         """
         Update filter button styling to show active filter.
 
         Args:
-            item_types: List of item types to mark as active
+            item_types: Item types to mark as active
         """
-        filter_key = tuple(item_types)
+        filter_key = frozenset(item_types)
         for key, button in self.filter_buttons.items():
             if key == filter_key:
                 button.setProperty("class", "filter-active")
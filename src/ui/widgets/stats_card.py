@@ -18,6 +18,8 @@ class StatsCard(QFrame):
         """
         super().__init__()
         self.colors = colors
+        # Last text set on each label, so unchanged values are not pushed to Qt again
+        self._label_texts: Dict[QLabel, str] = {}
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -94,6 +96,18 @@ class StatsCard(QFrame):
 
         layout.addLayout(total_grid)
 
+    def _set_text(self, label: QLabel, text: str) -> None:
+        """
+        Set a label's text only if it differs from what is already shown.
+
+        Args:
+            label: Label to update
+            text: New text
+        """
+        if self._label_texts.get(label) != text:
+            label.setText(text)
+            self._label_texts[label] = text
+
     def update_current_map_stats(self, duration: float, income: float, income_per_min: float) -> None:
         """
         Update current map statistics display.
@@ -105,9 +119,9 @@ class StatsCard(QFrame):
         """
         m = int(duration // 60)
         s = int(duration % 60)
-        self.label_current_time.setText(f"⏱ {m}m{s:02d}s")
-        self.label_current_speed.setText(f"🔥 {round(income_per_min, 2)} /min")
-        self.label_current_map_fe.setText(f"🔥 {round(income, 2)} FE")
+        self._set_text(self.label_current_time, f"⏱ {m}m{s:02d}s")
+        self._set_text(self.label_current_speed, f"🔥 {round(income_per_min, 2)} /min")
+        self._set_text(self.label_current_map_fe, f"🔥 {round(income, 2)} FE")
 
     def update_total_stats(self, duration: float, income: float, income_per_min: float, map_count: int) -> None:
         """
@@ -121,17 +135,17 @@ class StatsCard(QFrame):
         """
         m = int(duration // 60)
         s = int(duration % 60)
-        self.label_total_time.setText(f"⏱ {m}m{s:02d}s")
-        self.label_total_speed.setText(f"🔥 {round(income_per_min, 2)} /min")
-        self.label_total_fe.setText(f"🔥 {round(income, 2)} FE")
-        self.label_map_count.setText(f"🎫 {map_count} maps")
+        self._set_text(self.label_total_time, f"⏱ {m}m{s:02d}s")
+        self._set_text(self.label_total_speed, f"🔥 {round(income_per_min, 2)} /min")
+        self._set_text(self.label_total_fe, f"🔥 {round(income, 2)} FE")
+        self._set_text(self.label_map_count, f"🎫 {map_count} maps")
 
     def reset_stats(self) -> None:
         """Reset all statistics displays to zero."""
-        self.label_total_fe.setText("🔥 0 FE")
-        self.label_current_map_fe.setText("🔥 0 FE")
-        self.label_map_count.setText("🎫 0 maps")
-        self.label_current_time.setText("⏱ 0m00s")
-        self.label_current_speed.setText("🔥 0 /min")
-        self.label_total_time.setText("⏱ 0m00s")
-        self.label_total_speed.setText("🔥 0 /min")
+        self._set_text(self.label_total_fe, "🔥 0 FE")
+        self._set_text(self.label_current_map_fe, "🔥 0 FE")
+        self._set_text(self.label_map_count, "🎫 0 maps")
+        self._set_text(self.label_current_time, "⏱ 0m00s")
+        self._set_text(self.label_current_speed, "🔥 0 /min")
+        self._set_text(self.label_total_time, "⏱ 0m00s")
+        self._set_text(self.label_total_speed, "🔥 0 /min")
@@ -28,11 +28,13 @@ hiddenimports = [
     'win32gui',
     'psutil',
     'requests',
+    'orjson',
     'openpyxl',
     'openpyxl.cell',
     'openpyxl.styles',
     'openpyxl.utils',
     'src.constants',
+    'src.json_utils',
     'src.config_manager',
     'src.file_manager',
     'src.log_parser',